@@ -167,7 +167,7 @@ def compute_coa_pos_vel(
     # Compute transmit time
     assert proj_metadata.Xmt_Poly is not None
     x0 = _xyzpolyval(t_coa, proj_metadata.Xmt_Poly)
-    r_x0 = np.linalg.norm(x0 - grp_coa)
+    r_x0 = np.linalg.norm(x0 - grp_coa, axis=-1)
     tx_coa = t_coa - r_x0 / _constants.speed_of_light
 
     # Compute transmit APC position and velocity
@@ -176,7 +176,7 @@ def compute_coa_pos_vel(
 
     # Compute receive time
     r0 = _xyzpolyval(t_coa, proj_metadata.Rcv_Poly)
-    r_r0 = np.linalg.norm(r0 - grp_coa)
+    r_r0 = np.linalg.norm(r0 - grp_coa, axis=-1)
     tr_coa = t_coa + r_r0 / _constants.speed_of_light
 
     # Compute receive APC position and velocity
@@ -706,6 +706,247 @@ def compute_projection_sets(
     )
 
 
+def _projection_sets_jac(
+    proj_metadata: params.MetadataParams,
+    tgts: np.ndarray,
+    proj_set: params.ProjectionSetsLike,
+) -> params.ProjectionSetsLike:
+    """Derivatives of precomputed projection sets w.r.t. xrow and ycol.
+
+    The derivatives are stacked along a new axis of each component that follows the dimensions of `tgts` leading up
+    to xrow/ycol, e.g. ``R_COA`` is (..., 2) and ``ARP_COA`` is (..., 2, 3) for (..., 2) `tgts`.
+    """
+    # Derivatives are stacked along a new leading axis: index 0 is d/dxrow, index 1 is d/dycol
+    dtgts = np.eye(2).reshape((2,) + (1,) * (tgts.ndim - 1) + (2,))
+    dt_dil = (
+        npp.polyval2d(
+            tgts[..., 0], tgts[..., 1], npp.polyder(proj_metadata.cT_COA, axis=0)
+        )
+        * dtgts[..., 0]
+        + npp.polyval2d(
+            tgts[..., 0], tgts[..., 1], npp.polyder(proj_metadata.cT_COA, axis=1)
+        )
+        * dtgts[..., 1]
+    )
+    t_coa = proj_set.t_COA
+
+    if isinstance(proj_set, params.ProjectionSetsMono):
+        d_coa_pos_vels: params.CoaPosVelsLike = params.CoaPosVelsMono(
+            ARP_COA=dt_dil[..., np.newaxis] * proj_set.VARP_COA,
+            VARP_COA=dt_dil[..., np.newaxis]
+            * _xyzpolyval(t_coa, npp.polyder(proj_metadata.ARP_Poly, 2)),
+        )
+    else:
+        assert proj_metadata.GRP_Poly is not None
+        assert proj_metadata.Xmt_Poly is not None
+        assert proj_metadata.Rcv_Poly is not None
+        grp_coa = _xyzpolyval(t_coa, proj_metadata.GRP_Poly)
+        vgrp_coa = _xyzpolyval(t_coa, npp.polyder(proj_metadata.GRP_Poly))
+
+        # Transmit and receive times depend on the COA time through the GRP range
+        u_x0 = _xyzpolyval(t_coa, proj_metadata.Xmt_Poly) - grp_coa
+        u_x0 /= np.linalg.norm(u_x0, axis=-1, keepdims=True)
+        vx0 = _xyzpolyval(t_coa, npp.polyder(proj_metadata.Xmt_Poly))
+        dtx_dil = dt_dil * (
+            1 - ((vx0 - vgrp_coa) * u_x0).sum(axis=-1) / _constants.speed_of_light
+        )
+
+        u_r0 = _xyzpolyval(t_coa, proj_metadata.Rcv_Poly) - grp_coa
+        u_r0 /= np.linalg.norm(u_r0, axis=-1, keepdims=True)
+        vr0 = _xyzpolyval(t_coa, npp.polyder(proj_metadata.Rcv_Poly))
+        dtr_dil = dt_dil * (
+            1 + ((vr0 - vgrp_coa) * u_r0).sum(axis=-1) / _constants.speed_of_light
+        )
+
+        d_coa_pos_vels = params.CoaPosVelsBi(
+            GRP_COA=dt_dil[..., np.newaxis] * vgrp_coa,
+            tx_COA=dtx_dil,
+            tr_COA=dtr_dil,
+            Xmt_COA=dtx_dil[..., np.newaxis] * proj_set.VXmt_COA,
+            VXmt_COA=dtx_dil[..., np.newaxis]
+            * _xyzpolyval(proj_set.tx_COA, npp.polyder(proj_metadata.Xmt_Poly, 2)),
+            Rcv_COA=dtr_dil[..., np.newaxis] * proj_set.VRcv_COA,
+            VRcv_COA=dtr_dil[..., np.newaxis]
+            * _xyzpolyval(proj_set.tr_COA, npp.polyder(proj_metadata.Rcv_Poly, 2)),
+        )
+
+    dr_dil, drdot_dil = _compute_coa_r_rdot_jac(
+        proj_metadata, tgts, dtgts, proj_set, dt_dil, d_coa_pos_vels
+    )
+
+    def _il_axis_last(deriv):
+        return np.moveaxis(deriv, 0, tgts.ndim - 1)
+
+    if isinstance(d_coa_pos_vels, params.CoaPosVelsMono):
+        return params.ProjectionSetsMono(
+            t_COA=_il_axis_last(dt_dil),
+            ARP_COA=_il_axis_last(d_coa_pos_vels.ARP_COA),
+            VARP_COA=_il_axis_last(d_coa_pos_vels.VARP_COA),
+            R_COA=_il_axis_last(dr_dil),
+            Rdot_COA=_il_axis_last(drdot_dil),
+        )
+    return params.ProjectionSetsBi(
+        t_COA=_il_axis_last(dt_dil),
+        tx_COA=_il_axis_last(d_coa_pos_vels.tx_COA),
+        tr_COA=_il_axis_last(d_coa_pos_vels.tr_COA),
+        Xmt_COA=_il_axis_last(d_coa_pos_vels.Xmt_COA),
+        VXmt_COA=_il_axis_last(d_coa_pos_vels.VXmt_COA),
+        Rcv_COA=_il_axis_last(d_coa_pos_vels.Rcv_COA),
+        VRcv_COA=_il_axis_last(d_coa_pos_vels.VRcv_COA),
+        R_Avg_COA=_il_axis_last(dr_dil),
+        Rdot_Avg_COA=_il_axis_last(drdot_dil),
+    )
+
+
+def _r_rdot_jac(pos, vel, dpos, dvel, pt, dpt):
+    """Derivatives of the range and range rate of an APC relative to a point"""
+    r_vec = pos - pt
+    r = np.linalg.norm(r_vec, axis=-1, keepdims=True)
+    u = r_vec / r
+    dr_vec = dpos - dpt
+    dr = (dr_vec * u).sum(axis=-1)
+    du = (dr_vec - dr[..., np.newaxis] * u) / r
+    drdot = (dvel * u).sum(axis=-1) + (vel * du).sum(axis=-1)
+    return dr, drdot
+
+
+def _apc_r_rdot_jac(proj_set, d_coa_pos_vels, pt, dpt):
+    """Derivatives of the (average) range and range rate relative to the COA APC(s)"""
+    if isinstance(proj_set, params.ProjectionSetsMono):
+        return _r_rdot_jac(
+            proj_set.ARP_COA,
+            proj_set.VARP_COA,
+            d_coa_pos_vels.ARP_COA,
+            d_coa_pos_vels.VARP_COA,
+            pt,
+            dpt,
+        )
+    dr_xmt, drdot_xmt = _r_rdot_jac(
+        proj_set.Xmt_COA,
+        proj_set.VXmt_COA,
+        d_coa_pos_vels.Xmt_COA,
+        d_coa_pos_vels.VXmt_COA,
+        pt,
+        dpt,
+    )
+    dr_rcv, drdot_rcv = _r_rdot_jac(
+        proj_set.Rcv_COA,
+        proj_set.VRcv_COA,
+        d_coa_pos_vels.Rcv_COA,
+        d_coa_pos_vels.VRcv_COA,
+        pt,
+        dpt,
+    )
+    return (dr_xmt + dr_rcv) / 2.0, (drdot_xmt + drdot_rcv) / 2.0
+
+
+def _compute_coa_r_rdot_jac(
+    proj_metadata, tgts, dtgts, proj_set, dt_dil, d_coa_pos_vels
+):
+    """Derivatives of the COA R/Rdot contours, following the dispatch of `compute_coa_r_rdot`"""
+    rg_tgts = tgts[..., 0]
+    az_tgts = tgts[..., 1]
+    drg = dtgts[..., 0]
+    daz = dtgts[..., 1]
+    t_coa = proj_set.t_COA
+
+    if proj_metadata.Grid_Type == "RGAZIM" and proj_metadata.IFA in ("PFA", "RGAZCOMP"):
+        dr_scp, drdot_scp = _apc_r_rdot_jac(
+            proj_set, d_coa_pos_vels, proj_metadata.SCP, 0.0
+        )
+        if proj_metadata.IFA == "PFA":
+            assert proj_metadata.cPA is not None
+            assert proj_metadata.cKSF is not None
+            theta = npp.polyval(t_coa, proj_metadata.cPA)
+            dtheta_dt = npp.polyval(t_coa, npp.polyder(proj_metadata.cPA))
+            d2theta_dt2 = npp.polyval(t_coa, npp.polyder(proj_metadata.cPA, 2))
+            ksf = npp.polyval(theta, proj_metadata.cKSF)
+            dksf_dtheta = npp.polyval(theta, npp.polyder(proj_metadata.cKSF))
+            d2ksf_dtheta2 = npp.polyval(theta, npp.polyder(proj_metadata.cKSF, 2))
+            cos_theta = np.cos(theta)
+            sin_theta = np.sin(theta)
+            dphi_dka = rg_tgts * cos_theta + az_tgts * sin_theta
+            dphi_dkc = -rg_tgts * sin_theta + az_tgts * cos_theta
+
+            dtheta = dtheta_dt * dt_dil
+            ddphi_dka = drg * cos_theta + daz * sin_theta + dphi_dkc * dtheta
+            ddphi_dkc = -drg * sin_theta + daz * cos_theta - dphi_dka * dtheta
+
+            # delta_r = ksf * dphi_dka
+            dr = dr_scp + dksf_dtheta * dtheta * dphi_dka + ksf * ddphi_dka
+
+            # delta_rdot = (dksf_dtheta * dphi_dka + ksf * dphi_dkc) * dtheta_dt
+            rdot_factor = dksf_dtheta * dphi_dka + ksf * dphi_dkc
+            drdot_factor = (
+                d2ksf_dtheta2 * dtheta * dphi_dka
+                + dksf_dtheta * ddphi_dka
+                + dksf_dtheta * dtheta * dphi_dkc
+                + ksf * ddphi_dkc
+            )
+            drdot = (
+                drdot_scp
+                + drdot_factor * dtheta_dt
+                + rdot_factor * d2theta_dt2 * dt_dil
+            )
+            return dr, drdot
+
+        if not isinstance(proj_set, params.ProjectionSetsMono):
+            raise ValueError("coa_pos_vels must be monostatic for RGAZCOMP")
+        varp_mag = np.linalg.norm(proj_set.VARP_COA, axis=-1)
+        dvarp_mag = (proj_set.VARP_COA * d_coa_pos_vels.VARP_COA).sum(
+            axis=-1
+        ) / varp_mag
+        dr = dr_scp + drg
+        drdot = drdot_scp - proj_metadata.AzSF * (dvarp_mag * az_tgts + varp_mag * daz)
+        return dr, drdot
+
+    if proj_metadata.Grid_Type == "RGZERO":
+        assert proj_metadata.is_monostatic()
+        assert proj_metadata.cT_CA is not None
+        assert proj_metadata.cDRSF is not None
+        r_ca = proj_metadata.R_CA_SCP + rg_tgts
+        dr_ca = drg
+        t_ca = npp.polyval(az_tgts, proj_metadata.cT_CA)
+        dt_ca = npp.polyval(az_tgts, npp.polyder(proj_metadata.cT_CA)) * daz
+        varp_ca = _xyzpolyval(t_ca, npp.polyder(proj_metadata.ARP_Poly))
+        aarp_ca = _xyzpolyval(t_ca, npp.polyder(proj_metadata.ARP_Poly, 2))
+        varp_ca_mag2 = (varp_ca * varp_ca).sum(axis=-1)
+        dvarp_ca_mag2 = 2 * (varp_ca * aarp_ca).sum(axis=-1) * dt_ca
+        drsf = npp.polyval2d(rg_tgts, az_tgts, proj_metadata.cDRSF)
+        ddrsf = (
+            npp.polyval2d(rg_tgts, az_tgts, npp.polyder(proj_metadata.cDRSF, axis=0))
+            * drg
+            + npp.polyval2d(rg_tgts, az_tgts, npp.polyder(proj_metadata.cDRSF, axis=1))
+            * daz
+        )
+        delta_t_coa = t_coa - t_ca
+        ddelta_t_coa = dt_dil - dt_ca
+
+        # r = sqrt(r_ca**2 + g * delta_t_coa), rdot = g / r
+        g = drsf * varp_ca_mag2 * delta_t_coa
+        dg = (
+            ddrsf * varp_ca_mag2 * delta_t_coa
+            + drsf * dvarp_ca_mag2 * delta_t_coa
+            + drsf * varp_ca_mag2 * ddelta_t_coa
+        )
+        r = proj_set.R_COA
+        dr = (r_ca * dr_ca + (dg * delta_t_coa + g * ddelta_t_coa) / 2.0) / r
+        drdot = (dg - proj_set.Rdot_COA * dr) / r
+        return dr, drdot
+
+    if proj_metadata.Grid_Type in ("XRGYCR", "XCTYAT", "PLANE"):
+        ip_tgt = (
+            proj_metadata.SCP
+            + (rg_tgts[..., np.newaxis] * proj_metadata.uRow)
+            + (az_tgts[..., np.newaxis] * proj_metadata.uCol)
+        )
+        dip_tgt = (drg[..., np.newaxis] * proj_metadata.uRow) + (
+            daz[..., np.newaxis] * proj_metadata.uCol
+        )
+        return _apc_r_rdot_jac(proj_set, d_coa_pos_vels, ip_tgt, dip_tgt)
+    raise ValueError("Insufficient metadata to perform projection")
+
+
 def _check_look(look):
     if look not in (-1, +1):
         raise ValueError(f"Invalid {look=}; must be +1 or -1")
@@ -826,15 +1067,7 @@ def r_rdot_to_ground_plane_bi(
     gref = np.asarray(gref)
     ugpn = np.asarray(ugpn)
     # Compute initial ground points
-    scp_lat, scp_lon = sarkit.wgs84.cartesian_to_geodetic(scp)[:2]
-    u_up_scp = np.stack(
-        (
-            np.cos(np.deg2rad(scp_lat)) * np.cos(np.deg2rad(scp_lon)),
-            np.cos(np.deg2rad(scp_lat)) * np.sin(np.deg2rad(scp_lon)),
-            np.sin(np.deg2rad(scp_lat)),
-        ),
-        axis=-1,
-    )
+    u_up_scp = sarkit.wgs84.up(sarkit.wgs84.cartesian_to_geodetic(scp))
     dist_gp = ((gref - scp) * ugpn).sum(axis=-1, keepdims=True) / (u_up_scp * ugpn).sum(
         axis=-1, keepdims=True
     )
@@ -1212,19 +1445,10 @@ def r_rdot_to_constant_hae_surface(
 
     _check_look(look)
 
-    def _calc_up(lat_deg, lon_deg):
-        return np.stack(
-            (
-                np.cos(np.deg2rad(lat_deg)) * np.cos(np.deg2rad(lon_deg)),
-                np.cos(np.deg2rad(lat_deg)) * np.sin(np.deg2rad(lon_deg)),
-                np.sin(np.deg2rad(lat_deg)),
-            ),
-            axis=-1,
-        )
-
     # Compute parameters for ground plane 1
-    scp_lat, scp_lon, scp_hae = sarkit.wgs84.cartesian_to_geodetic(scp)
-    u_gpn1 = _calc_up(scp_lat, scp_lon)
+    scp_llh = sarkit.wgs84.cartesian_to_geodetic(scp)
+    scp_hae = scp_llh[..., 2]
+    u_gpn1 = sarkit.wgs84.up(scp_llh)
     gref1 = scp + (hae0 - scp_hae)[..., np.newaxis] * u_gpn1
 
     if isinstance(projection_sets, params.ProjectionSetsMono):
@@ -1295,7 +1519,7 @@ def r_rdot_to_constant_hae_surface(
         gpp_llh = sarkit.wgs84.cartesian_to_geodetic(gpp[above_threshold, :])
 
         # Compute unit vector in increasing height direction and height difference at GPP.
-        u_up[above_threshold, :] = _calc_up(gpp_llh[..., 0], gpp_llh[..., 1])
+        u_up[above_threshold, :] = sarkit.wgs84.up(gpp_llh)
         delta_hae[above_threshold] = gpp_llh[..., 2] - hae0[above_threshold]
 
         # Check if GPP is sufficiently close to HAE0 surface.
@@ -1,4 +1,5 @@
 import dataclasses
+import os
 from typing import TypeAlias
 
 import numpy as np
@@ -15,10 +16,17 @@ C = sarkit._constants.c
 # TODO: encouraged to migrate to type statements instead of TypeAlias in python 3.12
 SensitivityMatricesLike: TypeAlias = "SensitivityMatricesMono | SensitivityMatricesBi"
 
+# Shape checks on the sensitivity matrix dataclasses are internal consistency checks that add per-instance overhead;
+# they only run when the SARKIT_VALIDATE environment variable is set to "1" (and never under ``python -O``)
+_VALIDATE_SHAPES = __debug__ and os.environ.get("SARKIT_VALIDATE", "0") == "1"
+
 
 @dataclasses.dataclass(kw_only=True)
 class SlantPlaneSensitivityMatrices:
-    """Sensitivity matrices that relate changes in slant plane projection point. (Table 11-2)"""
+    """Sensitivity matrices that relate changes in slant plane projection point. (Table 11-2)
+
+    See `compute_sensitivity_matrices` for the layout of matrices computed for N-D scene points.
+    """
 
     M_SPXY_PT: np.ndarray
     M_SPXY_GPXY: np.ndarray
@@ -29,18 +37,23 @@ class SlantPlaneSensitivityMatrices:
     M_SPXY_RRdot: np.ndarray
 
     def __post_init__(self):
-        assert self.M_SPXY_PT.shape == (2, 3)
-        assert self.M_SPXY_GPXY.shape == (2, 2)
-        assert self.M_GPXY_SPXY.shape == (2, 2)
-        assert self.M_PT_GPXY.shape == (3, 2)
-        assert self.MIL_PT_HAE.shape == (3, 1)
-        assert self.M_RRdot_SPXY.shape == (2, 2)
-        assert self.M_SPXY_RRdot.shape == (2, 2)
+        if not _VALIDATE_SHAPES:
+            return
+        assert self.M_SPXY_PT.shape[-2:] == (2, 3)
+        assert self.M_SPXY_GPXY.shape[-2:] == (2, 2)
+        assert self.M_GPXY_SPXY.shape[-2:] == (2, 2)
+        assert self.M_PT_GPXY.shape[-2:] == (3, 2)
+        assert self.MIL_PT_HAE.shape[-2:] == (3, 1)
+        assert self.M_RRdot_SPXY.shape[-2:] == (2, 2)
+        assert self.M_SPXY_RRdot.shape[-2:] == (2, 2)
 
 
 @dataclasses.dataclass(kw_only=True)
 class ImageLocationSensitivityMatrices:
-    """Sensitivity matrices that relate changes in image grid location. (Table 11-3)"""
+    """Sensitivity matrices that relate changes in image grid location. (Table 11-3)
+
+    See `compute_sensitivity_matrices` for the layout of matrices computed for N-D scene points.
+    """
 
     M_IL_PT: np.ndarray
     M_GPXY_IL: np.ndarray
@@ -50,31 +63,41 @@ class ImageLocationSensitivityMatrices:
     M_IL_RRdot: np.ndarray
 
     def __post_init__(self):
-        assert self.M_IL_PT.shape == (2, 3)
-        assert self.M_GPXY_IL.shape == (2, 2)
-        assert self.M_SPXY_IL.shape == (2, 2)
-        assert self.M_IL_SPXY.shape == (2, 2)
-        assert self.M_RRdot_IL.shape == (2, 2)
-        assert self.M_IL_RRdot.shape == (2, 2)
+        if not _VALIDATE_SHAPES:
+            return
+        assert self.M_IL_PT.shape[-2:] == (2, 3)
+        assert self.M_GPXY_IL.shape[-2:] == (2, 2)
+        assert self.M_SPXY_IL.shape[-2:] == (2, 2)
+        assert self.M_IL_SPXY.shape[-2:] == (2, 2)
+        assert self.M_RRdot_IL.shape[-2:] == (2, 2)
+        assert self.M_IL_RRdot.shape[-2:] == (2, 2)
 
 
 @dataclasses.dataclass(kw_only=True)
 class PVTSensitivityMatricesMono:
-    """Monostatic position/velocity/timing sensitivity matrices (Table 11-4)"""
+    """Monostatic position/velocity/timing sensitivity matrices (Table 11-4)
+
+    See `compute_sensitivity_matrices` for the layout of matrices computed for N-D scene points.
+    """
 
     M_RRdot_delta_ARP: np.ndarray
     M_RRdot_delta_VARP: np.ndarray
     M_RRdot_CLK_SF: np.ndarray  # noqa: N815
 
     def __post_init__(self):
-        assert self.M_RRdot_delta_ARP.shape == (2, 3)
-        assert self.M_RRdot_delta_VARP.shape == (2, 3)
-        assert self.M_RRdot_CLK_SF.shape == (2, 1)
+        if not _VALIDATE_SHAPES:
+            return
+        assert self.M_RRdot_delta_ARP.shape[-2:] == (2, 3)
+        assert self.M_RRdot_delta_VARP.shape[-2:] == (2, 3)
+        assert self.M_RRdot_CLK_SF.shape[-2:] == (2, 1)
 
 
 @dataclasses.dataclass(kw_only=True)
 class PVTSensitivityMatricesBi:
-    """Bistatic position/velocity/timing sensitivity matrices (Table 11-5)"""
+    """Bistatic position/velocity/timing sensitivity matrices (Table 11-5)
+
+    See `compute_sensitivity_matrices` for the layout of matrices computed for N-D scene points.
+    """
 
     M_RRdot_delta_Xmt: np.ndarray
     M_RRdot_delta_VXmt: np.ndarray
@@ -84,12 +107,14 @@ class PVTSensitivityMatricesBi:
     M_RRdot_RTF: np.ndarray
 
     def __post_init__(self):
-        assert self.M_RRdot_delta_Xmt.shape == (2, 3)
-        assert self.M_RRdot_delta_VXmt.shape == (2, 3)
-        assert self.M_RRdot_XTF.shape == (2, 2)
-        assert self.M_RRdot_delta_Rcv.shape == (2, 3)
-        assert self.M_RRdot_delta_VRcv.shape == (2, 3)
-        assert self.M_RRdot_RTF.shape == (2, 2)
+        if not _VALIDATE_SHAPES:
+            return
+        assert self.M_RRdot_delta_Xmt.shape[-2:] == (2, 3)
+        assert self.M_RRdot_delta_VXmt.shape[-2:] == (2, 3)
+        assert self.M_RRdot_XTF.shape[-2:] == (2, 2)
+        assert self.M_RRdot_delta_Rcv.shape[-2:] == (2, 3)
+        assert self.M_RRdot_delta_VRcv.shape[-2:] == (2, 3)
+        assert self.M_RRdot_RTF.shape[-2:] == (2, 2)
 
 
 @dataclasses.dataclass(kw_only=True)
@@ -110,6 +135,22 @@ class SensitivityMatricesBi(
     """Sensitivity Matrices from IPDD for a bistatic image"""
 
 
+def _stack_2x2(m00, m01, m10, m11) -> np.ndarray:
+    """Stack (...) shaped matrix elements into (..., 2, 2) matrices"""
+    m00, m01, m10, m11 = np.broadcast_arrays(m00, m01, m10, m11)
+    return np.stack(
+        (np.stack((m00, m01), axis=-1), np.stack((m10, m11), axis=-1)), axis=-2
+    )
+
+
+def _inv2x2(m: np.ndarray) -> np.ndarray:
+    """Closed-form inverse of (..., 2, 2) matrices"""
+    a, b = m[..., 0, 0], m[..., 0, 1]
+    c, d = m[..., 1, 0], m[..., 1, 1]
+    det = a * d - b * c
+    return _stack_2x2(d / det, -b / det, -c / det, a / det)
+
+
 @dataclasses.dataclass(kw_only=True)
 class ProjGeomParamsMono:
     """Set of projection geometry parameters for Collect Type = Monostatic"""
@@ -117,6 +158,16 @@ class ProjGeomParamsMono:
     uPT: np.ndarray  # noqa: N815
     uPTDot: np.ndarray  # noqa: N815
 
+    @property
+    def p(self) -> np.ndarray:
+        """Pointing vector used to form the slant plane (uPT)"""
+        return self.uPT
+
+    @property
+    def pdot(self) -> np.ndarray:
+        """Time derivative of the slant plane pointing vector (uPTDot)"""
+        return self.uPTDot
+
 
 def compute_proj_geom_params_mono(
     proj_set_0: params.ProjectionSetsMono, pt0: npt.ArrayLike
@@ -127,8 +178,8 @@ def compute_proj_geom_params_mono(
     ----------
     proj_set_0 : ProjectionSetsMono
         Monostatic COA projection set for a projection pair: IL0 and PT0
-    pt0 : (3,) array_like
-        Scene point with ECEF (WGS 84 cartesian) X, Y, Z components in meters
+    pt0 : (..., 3) array_like
+        Scene points with ECEF (WGS 84 cartesian) X, Y, Z components in meters in the last dimension
 
     Returns
     -------
@@ -137,8 +188,11 @@ def compute_proj_geom_params_mono(
     """
     pt0 = np.asarray(pt0)
     # (1)
-    u_pt = (proj_set_0.ARP_COA - pt0) / proj_set_0.R_COA
-    u_pt_dot = (proj_set_0.VARP_COA - proj_set_0.Rdot_COA * u_pt) / proj_set_0.R_COA
+    r_coa = proj_set_0.R_COA[..., np.newaxis]
+    u_pt = (proj_set_0.ARP_COA - pt0) / r_coa
+    u_pt_dot = (
+        proj_set_0.VARP_COA - proj_set_0.Rdot_COA[..., np.newaxis] * u_pt
+    ) / r_coa
 
     return ProjGeomParamsMono(
         uPT=u_pt,
@@ -148,20 +202,34 @@ def compute_proj_geom_params_mono(
 
 @dataclasses.dataclass(kw_only=True)
 class ProjGeomParamsBi:
-    """Set of projection geometry parameters for Collect Type = Bistatic"""
+    """Set of projection geometry parameters for Collect Type = Bistatic
+
+    Scalar parameters are floats for a single scene point and arrays over the leading dimensions of the scene points
+    otherwise.
+    """
 
-    R_Xmt_0coa: float
-    Rdot_Xmt_0coa: float
-    R_Rcv_0coa: float
-    Rdot_Rcv_0coa: float
+    R_Xmt_0coa: float | np.ndarray
+    Rdot_Xmt_0coa: float | np.ndarray
+    R_Rcv_0coa: float | np.ndarray
+    Rdot_Rcv_0coa: float | np.ndarray
     uXmt: np.ndarray  # noqa: N815
     uXmtDot: np.ndarray  # noqa: N815
     uRcv: np.ndarray  # noqa: N815
     uRcvDot: np.ndarray  # noqa: N815
     bP: np.ndarray  # noqa: N815
     bPDot: np.ndarray  # noqa: N815
-    TRTX_0: float
-    TRTXdot_0: float
+    TRTX_0: float | np.ndarray
+    TRTXdot_0: float | np.ndarray
+
+    @property
+    def p(self) -> np.ndarray:
+        """Pointing vector used to form the slant plane (bP)"""
+        return self.bP
+
+    @property
+    def pdot(self) -> np.ndarray:
+        """Time derivative of the slant plane pointing vector (bPDot)"""
+        return self.bPDot
 
 
 def compute_proj_geom_params_bi(
@@ -176,8 +244,8 @@ def compute_proj_geom_params_bi(
     ----------
     proj_set_0 : ProjectionSetsBi
         Bistatic COA projection set for a projection pair: IL0 and PT0
-    pt0 : (3,) array_like
-        Scene point with ECEF (WGS 84 cartesian) X, Y, Z components in meters
+    pt0 : (..., 3) array_like
+        Scene points with ECEF (WGS 84 cartesian) X, Y, Z components in meters in the last dimension
     xmt_poly, rcv_poly : array_like
         Transmit APC and receive APC position vs time polynomial coefficients
 
@@ -188,26 +256,36 @@ def compute_proj_geom_params_bi(
     """
     pt0 = np.asarray(pt0)
     # (1)
-    r_xmt_0coa = np.linalg.norm(proj_set_0.Xmt_COA - pt0)
-    u_xmt = (proj_set_0.Xmt_COA - pt0) / r_xmt_0coa
-    rdot_xmt_0coa = np.dot(proj_set_0.VXmt_COA, u_xmt)
-    u_xmtdot = (proj_set_0.VXmt_COA - rdot_xmt_0coa * u_xmt) / r_xmt_0coa
-    axmt_0coa = npp.polyval(proj_set_0.tx_COA, npp.polyder(np.asarray(xmt_poly), 2))
-    rddot_xmt_0coa = (
-        np.dot(axmt_0coa, u_xmt)
-        + (np.linalg.norm(proj_set_0.VXmt_COA) ** 2 - rdot_xmt_0coa**2) / r_xmt_0coa
+    r_xmt_vec = proj_set_0.Xmt_COA - pt0
+    r_xmt_0coa = np.linalg.norm(r_xmt_vec, axis=-1)
+    inv_r_xmt_0coa = 1.0 / r_xmt_0coa
+    u_xmt = r_xmt_vec * inv_r_xmt_0coa[..., np.newaxis]
+    rdot_xmt_0coa = (proj_set_0.VXmt_COA * u_xmt).sum(axis=-1)
+    u_xmtdot = (
+        proj_set_0.VXmt_COA - rdot_xmt_0coa[..., np.newaxis] * u_xmt
+    ) * inv_r_xmt_0coa[..., np.newaxis]
+    axmt_0coa = _calc._xyzpolyval(
+        proj_set_0.tx_COA, npp.polyder(np.asarray(xmt_poly), 2)
     )
+    rddot_xmt_0coa = (axmt_0coa * u_xmt).sum(axis=-1) + (
+        (proj_set_0.VXmt_COA**2).sum(axis=-1) - rdot_xmt_0coa**2
+    ) * inv_r_xmt_0coa
 
     # (2)
-    r_rcv_0coa = np.linalg.norm(proj_set_0.Rcv_COA - pt0)
-    u_rcv = (proj_set_0.Rcv_COA - pt0) / r_rcv_0coa
-    rdot_rcv_0coa = np.dot(proj_set_0.VRcv_COA, u_rcv)
-    u_rcvdot = (proj_set_0.VRcv_COA - rdot_rcv_0coa * u_rcv) / r_rcv_0coa
-    arcv_0coa = npp.polyval(proj_set_0.tr_COA, npp.polyder(np.asarray(rcv_poly), 2))
-    rddot_rcv_0coa = (
-        np.dot(arcv_0coa, u_rcv)
-        + (np.linalg.norm(proj_set_0.VRcv_COA) ** 2 - rdot_rcv_0coa**2) / r_rcv_0coa
+    r_rcv_vec = proj_set_0.Rcv_COA - pt0
+    r_rcv_0coa = np.linalg.norm(r_rcv_vec, axis=-1)
+    inv_r_rcv_0coa = 1.0 / r_rcv_0coa
+    u_rcv = r_rcv_vec * inv_r_rcv_0coa[..., np.newaxis]
+    rdot_rcv_0coa = (proj_set_0.VRcv_COA * u_rcv).sum(axis=-1)
+    u_rcvdot = (
+        proj_set_0.VRcv_COA - rdot_rcv_0coa[..., np.newaxis] * u_rcv
+    ) * inv_r_rcv_0coa[..., np.newaxis]
+    arcv_0coa = _calc._xyzpolyval(
+        proj_set_0.tr_COA, npp.polyder(np.asarray(rcv_poly), 2)
     )
+    rddot_rcv_0coa = (arcv_0coa * u_rcv).sum(axis=-1) + (
+        (proj_set_0.VRcv_COA**2).sum(axis=-1) - rdot_rcv_0coa**2
+    ) * inv_r_rcv_0coa
 
     # (3)
     bp = (u_xmt + u_rcv) / 2.0
@@ -218,9 +296,9 @@ def compute_proj_geom_params_bi(
     trtxdot_0 = (rddot_xmt_0coa + rddot_rcv_0coa) / C
 
     return ProjGeomParamsBi(
-        R_Xmt_0coa=float(r_xmt_0coa),
+        R_Xmt_0coa=r_xmt_0coa,
         Rdot_Xmt_0coa=rdot_xmt_0coa,
-        R_Rcv_0coa=float(r_rcv_0coa),
+        R_Rcv_0coa=r_rcv_0coa,
         Rdot_Rcv_0coa=rdot_rcv_0coa,
         uXmt=u_xmt,
         uXmtDot=u_xmtdot,
@@ -228,60 +306,46 @@ def compute_proj_geom_params_bi(
         uRcvDot=u_rcvdot,
         bP=bp,
         bPDot=bpdot,
-        TRTX_0=float(trtx_0),
-        TRTXdot_0=float(trtxdot_0),
+        TRTX_0=trtx_0,
+        TRTXdot_0=trtxdot_0,
     )
 
 
-def _get_proj_parameters(
-    proj_metadata: params.MetadataParams,
-    pt0: npt.ArrayLike | None = None,
-    u_gpn0: npt.ArrayLike | None = None,
-) -> tuple[np.ndarray, np.ndarray]:
-    """Return an ECF scene point and unit normal to scene surface"""
+def _get_scene_points(
+    proj_metadata: params.MetadataParams, pt0: npt.ArrayLike | None = None
+) -> np.ndarray:
+    """Return ECF scene points, defaulting to the SCP"""
     if pt0 is None:
         pt0 = proj_metadata.SCP
     pt0 = np.asarray(pt0)
-    pt0_lat, pt0_lon = sarkit.wgs84.cartesian_to_geodetic(pt0)[:2]
-    u_up0 = np.stack(
-        (
-            np.cos(np.deg2rad(pt0_lat)) * np.cos(np.deg2rad(pt0_lon)),
-            np.cos(np.deg2rad(pt0_lat)) * np.sin(np.deg2rad(pt0_lon)),
-            np.sin(np.deg2rad(pt0_lat)),
-        )
-    )
-    if u_gpn0 is None:
-        u_gpn0 = u_up0
-    u_gpn0 = np.asarray(u_gpn0)
-    assert np.dot(u_gpn0, u_up0) > 0
-    assert pt0.shape == (3,)
-    assert u_gpn0.shape == (3,)
-    return pt0, u_gpn0
+    assert pt0.shape[-1] == 3
+    return pt0
 
 
-def compute_slant_plane_sensitivity_matrices(
+def _get_proj_parameters(
     proj_metadata: params.MetadataParams,
     pt0: npt.ArrayLike | None = None,
     u_gpn0: npt.ArrayLike | None = None,
-) -> SlantPlaneSensitivityMatrices:
-    """Compute the defined slant plane sensitivity matrices.
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Return ECF scene points, unit normals to scene surface and ETP up-vectors broadcast to a common shape"""
+    pt0 = _get_scene_points(proj_metadata, pt0)
+    u_up0 = sarkit.wgs84.up(sarkit.wgs84.cartesian_to_geodetic(pt0))
+    if u_gpn0 is None:
+        u_gpn0 = u_up0
+    pt0, u_gpn0, u_up0 = np.broadcast_arrays(pt0, np.asarray(u_gpn0), u_up0)
+    assert np.all((u_gpn0 * u_up0).sum(axis=-1) > 0)
+    return pt0, u_gpn0, u_up0
 
-    Parameters
-    ----------
-    proj_metadata : MetadataParams
-        Metadata parameters relevant to projection.
-    pt0 : array_like, optional
-        ECF scene point. Defaults to SCP.
-    u_gpn0 : array_like, optional
-        unit normal to scene surface at pt0. Defaults to ETP normal at pt0.
 
-    Returns
-    -------
-    SlantPlaneSensitivityMatrices
-    """
-
-    pt0, u_gpn0 = _get_proj_parameters(proj_metadata, pt0, u_gpn0)
+def _compute_point_geometry(
+    proj_metadata: params.MetadataParams, pt0: np.ndarray
+) -> tuple[
+    np.ndarray, params.ProjectionSetsLike, ProjGeomParamsMono | ProjGeomParamsBi
+]:
+    """Return the image grid locations, COA projection sets and projection geometry parameters of scene points
 
+    Private method for re-use so that the sensitivity matrices computed together share one projection.
+    """
     il0, _, _ = _calc.scene_to_image(proj_metadata, pt0)
     proj_set_0 = _calc.compute_projection_sets(proj_metadata, il0)
 
@@ -295,68 +359,183 @@ def compute_slant_plane_sensitivity_matrices(
         geom_params = compute_proj_geom_params_bi(
             proj_set_0, pt0, proj_metadata.Xmt_Poly, proj_metadata.Rcv_Poly
         )
+    return il0, proj_set_0, geom_params
 
+
+def _spc_gpc_frames(
+    p: np.ndarray,
+    pdot: np.ndarray,
+    u_gpn0: np.ndarray,
+    look: int,
+) -> tuple[np.ndarray, ...]:
+    """Slant plane and ground plane coordinate unit vectors with the grazing and twist angle cosines/sines.
+
+    Returns ``(u_spx, u_spy, u_spz, u_gpx, u_gpy, u_gpz, cos_graz, sin_graz, cos_twst, sin_twst)`` computed over
+    (..., 3) arrays of vectors.
+    """
     # SPC & GPC Parameters
     # (1)
-    if isinstance(geom_params, ProjGeomParamsMono):
-        spx = geom_params.uPT
-        spz = proj_metadata.LOOK * np.cross(geom_params.uPT, geom_params.uPTDot)
-    else:
-        spx = geom_params.bP
-        spz = proj_metadata.LOOK * np.cross(geom_params.bP, geom_params.bPDot)
+    spx = p
+    spz = look * np.cross(p, pdot)
 
     # (2)
-    u_spx = spx / np.linalg.norm(spx)
-    u_spz = spz / np.linalg.norm(spz)
+    u_spx = spx / np.linalg.norm(spx, axis=-1, keepdims=True)
+    u_spz = spz / np.linalg.norm(spz, axis=-1, keepdims=True)
     u_spy = np.cross(u_spz, u_spx)
 
     # (3)
     u_gpz = u_gpn0
     gpy = np.cross(u_gpz, u_spx)
-    u_gpy = gpy / np.linalg.norm(gpy)
+    u_gpy = gpy / np.linalg.norm(gpy, axis=-1, keepdims=True)
     u_gpx = np.cross(u_gpy, u_gpz)
 
-    # (4)
-    cos_graz = np.dot(u_spx, u_gpx)
-    sin_graz = np.dot(u_spx, u_gpz)
-    cos_twst = np.dot(u_spy, u_gpy)
-    sin_twst = -np.dot(u_spz, u_gpy)
-    tan_graz = sin_graz / cos_graz
-    tan_twst = sin_twst / cos_twst
+    # (4) - all SPC/GPC unit vector dot products from a single (..., 3, 3) product
+    spc = np.stack(np.broadcast_arrays(u_spx, u_spy, u_spz), axis=-2)
+    gpc = np.stack(np.broadcast_arrays(u_gpx, u_gpy, u_gpz), axis=-2)
+    spc_dot_gpc = np.einsum("...ij,...kj->...ik", spc, gpc)
+    cos_graz = spc_dot_gpc[..., 0, 0]
+    sin_graz = spc_dot_gpc[..., 0, 2]
+    cos_twst = spc_dot_gpc[..., 1, 1]
+    sin_twst = -spc_dot_gpc[..., 2, 1]
+    return (
+        u_spx,
+        u_spy,
+        u_spz,
+        u_gpx,
+        u_gpy,
+        u_gpz,
+        cos_graz,
+        sin_graz,
+        cos_twst,
+        sin_twst,
+    )
+
+
+def _slant_plane_kernel(
+    p: np.ndarray,
+    pdot: np.ndarray,
+    u_gpn0: np.ndarray,
+    u_up0: np.ndarray,
+    look: int,
+) -> tuple[np.ndarray, ...]:
+    """Fixed-shape arithmetic of the slant plane sensitivity matrices.
+
+    `p` and `pdot` are uPT and uPTDot for a monostatic image or bP and bPDot for a bistatic image.
+    All vector arguments are (..., 3) and broadcast against each other.
+
+    Returns the matrices in the order of the `SlantPlaneSensitivityMatrices` attributes.
+    """
+    (
+        u_spx,
+        u_spy,
+        u_spz,
+        u_gpx,
+        u_gpy,
+        u_gpz,
+        cos_graz,
+        sin_graz,
+        cos_twst,
+        sin_twst,
+    ) = _spc_gpc_frames(p, pdot, u_gpn0, look)
 
     # Slant Plane Sensitivity Matrices
     # (1)
-    m_spxy_pt = np.stack((u_spx, u_spy))
+    m_spxy_pt = np.stack((u_spx, u_spy), axis=-2)
 
     # (2)
-    m_spxy_gpxy = np.asarray([[cos_graz, 0], [-sin_graz * sin_twst, cos_twst]])
-
-    # (3)
-    m_gpxy_spxy = np.asarray([[1 / cos_graz, 0], [tan_graz * tan_twst, 1 / cos_twst]])
+    m_spxy_gpxy = _stack_2x2(cos_graz, 0.0, -sin_graz * sin_twst, cos_twst)
+
+    # (3) - inverse of the lower triangular M_SPXY_GPXY; equivalent to the IPDD's tan(graz) * tan(twst) form
+    inv_cos_graz = 1.0 / cos_graz
+    inv_cos_twst = 1.0 / cos_twst
+    m_gpxy_spxy = _stack_2x2(
+        inv_cos_graz,
+        0.0,
+        sin_graz * sin_twst * inv_cos_graz * inv_cos_twst,
+        inv_cos_twst,
+    )
 
     # (4)
-    m_pt_gpxy = np.stack((u_gpx, u_gpy)).T
+    m_pt_gpxy = np.stack((u_gpx, u_gpy), axis=-1)
 
     # (5)
-    u_up0 = _get_proj_parameters(proj_metadata, pt0)[1]
-    spz_sf = np.dot(u_up0, u_gpz) / np.dot(u_spz, u_gpz)
-    mil_pt_hae = spz_sf * u_spz.reshape((3, 1))
-
-    # (6)
-    if isinstance(geom_params, ProjGeomParamsMono):
-        p = geom_params.uPT
-        pdot = geom_params.uPTDot
-    else:
-        p = geom_params.bP
-        pdot = geom_params.bPDot
+    spz_sf = (u_up0 * u_gpz).sum(axis=-1) / (u_spz * u_gpz).sum(axis=-1)
+    mil_pt_hae = (spz_sf[..., np.newaxis] * u_spz)[..., np.newaxis]
 
+    # (6) - p, pdot provided by caller
     # (7)
-    m_rrdot_spxy = -np.array(
-        [[np.dot(p, u_spx), 0.0], [np.dot(pdot, u_spx), np.dot(pdot, u_spy)]]
+    m_rrdot_spxy = -_stack_2x2(
+        (p * u_spx).sum(axis=-1),
+        0.0,
+        (pdot * u_spx).sum(axis=-1),
+        (pdot * u_spy).sum(axis=-1),
     )
 
     # (8)
-    m_spxy_rrdot = np.linalg.inv(m_rrdot_spxy)
+    m_spxy_rrdot = _inv2x2(m_rrdot_spxy)
+
+    return (
+        m_spxy_pt,
+        m_spxy_gpxy,
+        m_gpxy_spxy,
+        m_pt_gpxy,
+        mil_pt_hae,
+        m_rrdot_spxy,
+        m_spxy_rrdot,
+    )
+
+
+def compute_slant_plane_sensitivity_matrices(
+    proj_metadata: params.MetadataParams,
+    pt0: npt.ArrayLike | None = None,
+    u_gpn0: npt.ArrayLike | None = None,
+) -> SlantPlaneSensitivityMatrices:
+    """Compute the defined slant plane sensitivity matrices.
+
+    Parameters
+    ----------
+    proj_metadata : MetadataParams
+        Metadata parameters relevant to projection.
+    pt0 : (..., 3) array_like, optional
+        ECF scene points. Defaults to SCP.
+    u_gpn0 : (..., 3) array_like, optional
+        unit normal to scene surface at pt0. Defaults to ETP normal at pt0.
+
+    Returns
+    -------
+    SlantPlaneSensitivityMatrices
+        Matrices with leading dimensions broadcast from `pt0` and `u_gpn0`.
+
+    Notes
+    -----
+    The matrices are computed with array operations over the leading dimensions of `pt0` and `u_gpn0`.
+    Sweeps over many scene points (e.g. one per image pixel) are most efficiently evaluated in a single call
+    rather than point by point.
+    """
+
+    pt0, u_gpn0, u_up0 = _get_proj_parameters(proj_metadata, pt0, u_gpn0)
+    _, _, geom_params = _compute_point_geometry(proj_metadata, pt0)
+    return _slant_plane_sensitivity_matrices(proj_metadata, u_gpn0, u_up0, geom_params)
+
+
+def _slant_plane_sensitivity_matrices(
+    proj_metadata: params.MetadataParams,
+    u_gpn0: np.ndarray,
+    u_up0: np.ndarray,
+    geom_params: ProjGeomParamsMono | ProjGeomParamsBi,
+) -> SlantPlaneSensitivityMatrices:
+    """Slant plane sensitivity matrices from precomputed projection geometry parameters"""
+    (
+        m_spxy_pt,
+        m_spxy_gpxy,
+        m_gpxy_spxy,
+        m_pt_gpxy,
+        mil_pt_hae,
+        m_rrdot_spxy,
+        m_spxy_rrdot,
+    ) = _slant_plane_kernel(
+        geom_params.p, geom_params.pdot, u_gpn0, u_up0, proj_metadata.LOOK
+    )
 
     return SlantPlaneSensitivityMatrices(
         M_SPXY_PT=m_spxy_pt,
@@ -375,6 +554,7 @@ def compute_image_location_sensitivity_matrices(
     u_gpn0: npt.ArrayLike | None = None,
     delta_xrow: float | None = None,
     delta_ycol: float | None = None,
+    analytic: bool = False,
 ) -> ImageLocationSensitivityMatrices:
     """Compute the defined image location sensitivity matrices
 
@@ -382,184 +562,138 @@ def compute_image_location_sensitivity_matrices(
     ----------
     proj_metadata : MetadataParams
         Metadata parameters relevant to projection.
-    pt0 : array_like, optional
-        ECF scene point. Defaults to SCP.
-    u_gpn0 : array_like, optional
+    pt0 : (..., 3) array_like, optional
+        ECF scene points. Defaults to SCP.
+    u_gpn0 : (..., 3) array_like, optional
         unit normal to scene surface at pt0. Defaults to ETP normal at pt0.
     delta_xrow : float, optional
-        row coordinate increment (m).  Defaults to min(Row_SS, 1.0).
+        row coordinate increment (m) used when `analytic` is False.  Defaults to min(Row_SS, 1.0).
     delta_ycol : float, optional
-        col coordinate increment (m).  Defaults to min(Col_SS, 1.0).
+        col coordinate increment (m) used when `analytic` is False.  Defaults to min(Col_SS, 1.0).
+    analytic : bool, optional
+        If True, M_RRdot_IL is computed from analytic derivatives of the COA projection set.
+        Otherwise (default), it is approximated with finite differences over `delta_xrow` and `delta_ycol`.
 
     Returns
     -------
     ImageLocationSensitivityMatrices
+        Matrices with leading dimensions broadcast from `pt0` and `u_gpn0`.
     """
 
-    pt0, u_gpn0 = _get_proj_parameters(proj_metadata, pt0, u_gpn0)
-
-    if delta_xrow is None:
-        delta_xrow = min(1.0, proj_metadata.Row_SS)
-    if delta_ycol is None:
-        delta_ycol = min(1.0, proj_metadata.Col_SS)
-    assert np.isscalar(delta_xrow)
-    assert np.isscalar(delta_ycol)
+    pt0, u_gpn0, u_up0 = _get_proj_parameters(proj_metadata, pt0, u_gpn0)
+    il0, proj_set_0, geom_params = _compute_point_geometry(proj_metadata, pt0)
+    sp_mats = _slant_plane_sensitivity_matrices(
+        proj_metadata, u_gpn0, u_up0, geom_params
+    )
+    return _image_location_sensitivity_matrices(
+        proj_metadata,
+        il0,
+        proj_set_0,
+        geom_params,
+        sp_mats,
+        delta_xrow,
+        delta_ycol,
+        analytic,
+    )
 
-    il0, _, _ = _calc.scene_to_image(proj_metadata, pt0)
-    proj_set_0 = _calc.compute_projection_sets(proj_metadata, il0)
 
-    # Projection Geometry Parameters
-    proj_parameters: ProjGeomParamsMono | ProjGeomParamsBi
-    if isinstance(proj_set_0, params.ProjectionSetsMono):
-        proj_parameters = compute_proj_geom_params_mono(proj_set_0, pt0)
-    else:
-        assert proj_metadata.Xmt_Poly is not None
-        assert proj_metadata.Rcv_Poly is not None
-        proj_parameters = compute_proj_geom_params_bi(
-            proj_set_0, pt0, proj_metadata.Xmt_Poly, proj_metadata.Rcv_Poly
-        )
+def _difference_quotient(
+    proj_set_1: params.ProjectionSetsLike,
+    proj_set_0: params.ProjectionSetsLike,
+    deltas: np.ndarray,
+    axis: int,
+) -> params.ProjectionSetsLike:
+    """Finite difference approximation of projection set derivatives from increments stacked along `axis`"""
+
+    def _quotient(value_1, value_0):
+        # trailing dimensions of vector components follow the increment axis
+        delta = deltas.reshape(deltas.shape + (1,) * (value_1.ndim - axis - 1))
+        return (value_1 - np.expand_dims(value_0, axis)) / delta
+
+    return dataclasses.replace(
+        proj_set_1,
+        **{
+            field.name: _quotient(
+                getattr(proj_set_1, field.name), getattr(proj_set_0, field.name)
+            )
+            for field in dataclasses.fields(proj_set_1)
+        },
+    )
 
-    sp_mats = compute_slant_plane_sensitivity_matrices(proj_metadata, pt0, u_gpn0)
 
+def _image_location_sensitivity_matrices(
+    proj_metadata: params.MetadataParams,
+    il0: np.ndarray,
+    proj_set_0: params.ProjectionSetsLike,
+    proj_parameters: ProjGeomParamsMono | ProjGeomParamsBi,
+    sp_mats: SlantPlaneSensitivityMatrices,
+    delta_xrow: float | None,
+    delta_ycol: float | None,
+    analytic: bool,
+) -> ImageLocationSensitivityMatrices:
+    """Image location sensitivity matrices from a precomputed projection and slant plane sensitivity matrices"""
     # Image Location Sensitivity Matrices
-    # (1)
-    il1x = il0 + [delta_xrow, 0]
-
-    # (2)
-    il1y = il0 + [0, delta_ycol]
+    # The row and column increments of (1) - (6) are expressed as rates of change w.r.t. xrow and ycol so that they
+    # can be evaluated either analytically or from finite differences.  Both are stacked along an increment axis
+    # following the leading dimensions of il0 and evaluated together.
+    if analytic:
+        dproj_set = _calc._projection_sets_jac(proj_metadata, il0, proj_set_0)
+    else:
+        if delta_xrow is None:
+            delta_xrow = min(1.0, proj_metadata.Row_SS)
+        if delta_ycol is None:
+            delta_ycol = min(1.0, proj_metadata.Col_SS)
+        assert np.isscalar(delta_xrow)
+        assert np.isscalar(delta_ycol)
+
+        # (1) & (4)
+        deltas = np.array([delta_xrow, delta_ycol])
+        il1 = il0[..., np.newaxis, :] + np.diag(deltas)
+        dproj_set = _difference_quotient(
+            _calc.compute_projection_sets(proj_metadata, il1),
+            proj_set_0,
+            deltas,
+            axis=il0.ndim - 1,
+        )
 
-    proj_set_1x = _calc.compute_projection_sets(proj_metadata, il1x)
-    proj_set_1y = _calc.compute_projection_sets(proj_metadata, il1y)
+    def _dot(dvec, vec):
+        # dvec has the increment axis, vec does not
+        return (dvec * vec[..., np.newaxis, :]).sum(axis=-1)
 
-    if isinstance(proj_set_1x, params.ProjectionSetsMono):
-        assert isinstance(proj_set_0, params.ProjectionSetsMono)
-        assert isinstance(proj_set_1y, params.ProjectionSetsMono)
+    if isinstance(dproj_set, params.ProjectionSetsMono):
         assert isinstance(proj_parameters, ProjGeomParamsMono)
         # Monostatic delta RRdot
-        # (2)
-        delta_arp1x_coa = proj_set_1x.ARP_COA - proj_set_0.ARP_COA
-        delta_varp1x_coa = proj_set_1x.VARP_COA - proj_set_0.VARP_COA
-
-        # (3)
-        delta_r_1x = (
-            proj_set_1x.R_COA
-            - proj_set_0.R_COA
-            - np.dot(delta_arp1x_coa, proj_parameters.uPT)
-        )
-        delta_rdot_1x = (
-            proj_set_1x.Rdot_COA
-            - proj_set_0.Rdot_COA
-            - (
-                np.dot(delta_arp1x_coa, proj_parameters.uPTDot)
-                + np.dot(delta_varp1x_coa, proj_parameters.uPT)
-            )
-        )
-
-        # (4) - Done above
-        # (5)
-        delta_arp1y_coa = proj_set_1y.ARP_COA - proj_set_0.ARP_COA
-        delta_varp1y_coa = proj_set_1y.VARP_COA - proj_set_0.VARP_COA
-
-        # (6)
-        delta_r_1y = (
-            proj_set_1y.R_COA
-            - proj_set_0.R_COA
-            - np.dot(delta_arp1y_coa, proj_parameters.uPT)
+        # (2) & (3), (5) & (6)
+        delta_r = dproj_set.R_COA - _dot(dproj_set.ARP_COA, proj_parameters.uPT)
+        delta_rdot = dproj_set.Rdot_COA - (
+            _dot(dproj_set.ARP_COA, proj_parameters.uPTDot)
+            + _dot(dproj_set.VARP_COA, proj_parameters.uPT)
         )
-        delta_rdot_1y = (
-            proj_set_1y.Rdot_COA
-            - proj_set_0.Rdot_COA
-            - (
-                np.dot(delta_arp1y_coa, proj_parameters.uPTDot)
-                + np.dot(delta_varp1y_coa, proj_parameters.uPT)
-            )
-        )
-
-        # (7)
-        m_rrdot_il = np.array(
-            [
-                [delta_r_1x / delta_xrow, delta_r_1y / delta_ycol],
-                [delta_rdot_1x / delta_xrow, delta_rdot_1y / delta_ycol],
-            ]
-        )
-        m_il_rrdot = np.linalg.inv(m_rrdot_il)
     else:
-        assert isinstance(proj_set_0, params.ProjectionSetsBi)
-        assert isinstance(proj_set_1y, params.ProjectionSetsBi)
         assert isinstance(proj_parameters, ProjGeomParamsBi)
         # Bistatic
-        # (1) - Done above
-        # (2)
-        delta_xmt_1xcoa = proj_set_1x.Xmt_COA - proj_set_0.Xmt_COA
-        delta_vxmt_1xcoa = proj_set_1x.VXmt_COA - proj_set_0.VXmt_COA
-        delta_rcv_1xcoa = proj_set_1x.Rcv_COA - proj_set_0.Rcv_COA
-        delta_vrcv_1xcoa = proj_set_1x.VRcv_COA - proj_set_0.VRcv_COA
-
-        # (3)
-        delta_r_avg_1x = (
-            proj_set_1x.R_Avg_COA
-            - proj_set_0.R_Avg_COA
-            - 0.5
-            * (
-                np.dot(delta_xmt_1xcoa, proj_parameters.uXmt)
-                + np.dot(delta_rcv_1xcoa, proj_parameters.uRcv)
-            )
-        )
-        delta_rdot_avg_1x = (
-            proj_set_1x.Rdot_Avg_COA
-            - proj_set_0.Rdot_Avg_COA
-            - 0.5
-            * (
-                np.dot(delta_xmt_1xcoa, proj_parameters.uXmtDot)
-                + np.dot(delta_vxmt_1xcoa, proj_parameters.uXmt)
-            )
-            - 0.5
-            * (
-                np.dot(delta_rcv_1xcoa, proj_parameters.uRcvDot)
-                + np.dot(delta_vrcv_1xcoa, proj_parameters.uRcv)
-            )
-        )
-
-        # (4) - Done above
-        # (5)
-        delta_xmt_1ycoa = proj_set_1y.Xmt_COA - proj_set_0.Xmt_COA
-        delta_vxmt_1ycoa = proj_set_1y.VXmt_COA - proj_set_0.VXmt_COA
-        delta_rcv_1ycoa = proj_set_1y.Rcv_COA - proj_set_0.Rcv_COA
-        delta_vrcv_1ycoa = proj_set_1y.VRcv_COA - proj_set_0.VRcv_COA
-
-        # (6)
-        delta_r_avg_1y = (
-            proj_set_1y.R_Avg_COA
-            - proj_set_0.R_Avg_COA
-            - 0.5
-            * (
-                np.dot(delta_xmt_1ycoa, proj_parameters.uXmt)
-                + np.dot(delta_rcv_1ycoa, proj_parameters.uRcv)
-            )
+        # (2) & (3), (5) & (6)
+        delta_r = dproj_set.R_Avg_COA - 0.5 * (
+            _dot(dproj_set.Xmt_COA, proj_parameters.uXmt)
+            + _dot(dproj_set.Rcv_COA, proj_parameters.uRcv)
         )
-        delta_rdot_avg_1y = (
-            proj_set_1y.Rdot_Avg_COA
-            - proj_set_0.Rdot_Avg_COA
+        delta_rdot = (
+            dproj_set.Rdot_Avg_COA
             - 0.5
             * (
-                np.dot(delta_xmt_1ycoa, proj_parameters.uXmtDot)
-                + np.dot(delta_vxmt_1ycoa, proj_parameters.uXmt)
+                _dot(dproj_set.Xmt_COA, proj_parameters.uXmtDot)
+                + _dot(dproj_set.VXmt_COA, proj_parameters.uXmt)
             )
             - 0.5
             * (
-                np.dot(delta_rcv_1ycoa, proj_parameters.uRcvDot)
-                + np.dot(delta_vrcv_1ycoa, proj_parameters.uRcv)
+                _dot(dproj_set.Rcv_COA, proj_parameters.uRcvDot)
+                + _dot(dproj_set.VRcv_COA, proj_parameters.uRcv)
             )
         )
 
-        # (7)
-        m_rrdot_il = np.array(
-            [
-                [delta_r_avg_1x / delta_xrow, delta_r_avg_1y / delta_ycol],
-                [delta_rdot_avg_1x / delta_xrow, delta_rdot_avg_1y / delta_ycol],
-            ]
-        )
-        m_il_rrdot = np.linalg.inv(m_rrdot_il)
+    # (7) - rows are R and Rdot, columns are the xrow and ycol increments
+    m_rrdot_il = np.stack((delta_r, delta_rdot), axis=-2)
+    m_il_rrdot = _inv2x2(m_rrdot_il)
 
     # Image Location & Slant Plane Sensitivity
     # (1)
@@ -592,36 +726,44 @@ def compute_pvt_sensitivity_matrices_mono(
     ----------
     proj_metadata : MetadataParams
         Metadata parameters relevant to projection.
-    pt0 : array_like, optional
-        ECF scene point. Defaults to SCP.
+    pt0 : (..., 3) array_like, optional
+        ECF scene points. Defaults to SCP.
 
     Returns
     -------
     PVTSensitivityMatricesMono
+        Matrices with leading dimensions matching those of `pt0`.
     """
-    pt0, _ = _get_proj_parameters(proj_metadata, pt0)
-
-    il0, _, _ = _calc.scene_to_image(proj_metadata, pt0)
-    proj_set_0 = _calc.compute_projection_sets(proj_metadata, il0)
+    pt0 = _get_scene_points(proj_metadata, pt0)
+    _, proj_set_0, geom_params = _compute_point_geometry(proj_metadata, pt0)
     assert isinstance(proj_set_0, params.ProjectionSetsMono)
-    geom_params = compute_proj_geom_params_mono(proj_set_0, pt0)
+    assert isinstance(geom_params, ProjGeomParamsMono)
+    return _pvt_sensitivity_matrices_mono(proj_metadata, proj_set_0, geom_params)
 
+
+def _pvt_sensitivity_matrices_mono(
+    proj_metadata: params.MetadataParams,
+    proj_set_0: params.ProjectionSetsMono,
+    geom_params: ProjGeomParamsMono,
+) -> PVTSensitivityMatricesMono:
+    """Monostatic PVT sensitivity matrices from precomputed projection geometry parameters"""
     # (1)
-    m_rrdot_delta_arp = -np.stack([geom_params.uPT, geom_params.uPTDot])
+    m_rrdot_delta_arp = -np.stack([geom_params.uPT, geom_params.uPTDot], axis=-2)
 
     # (2)
-    delta_t_il0_coa = proj_set_0.t_COA - proj_metadata.t_SCP_COA
+    delta_t_il0_coa = (proj_set_0.t_COA - proj_metadata.t_SCP_COA)[..., np.newaxis]
     m_rrdot_delta_varp = -np.stack(
         [
             geom_params.uPT * delta_t_il0_coa,
             geom_params.uPT + geom_params.uPTDot * delta_t_il0_coa,
-        ]
+        ],
+        axis=-2,
     )
 
     # (3)
     crsf = -proj_set_0.R_COA
-    crdotsf = 0
-    m_rrdot_clk_sf = np.array([crsf, crdotsf]).reshape((2, 1))
+    crdotsf = np.zeros_like(crsf)
+    m_rrdot_clk_sf = np.stack([crsf, crdotsf], axis=-1)[..., np.newaxis]
 
     return PVTSensitivityMatricesMono(
         M_RRdot_delta_ARP=m_rrdot_delta_arp,
@@ -640,60 +782,67 @@ def compute_pvt_sensitivity_matrices_bi(
     ----------
     proj_metadata : MetadataParams
         Metadata parameters relevant to projection.
-    pt0 : array_like, optional
-        ECF scene point. Defaults to SCP.
+    pt0 : (..., 3) array_like, optional
+        ECF scene points. Defaults to SCP.
 
     Returns
     -------
     PVTSensitivityMatricesBi
+        Matrices with leading dimensions matching those of `pt0`.
     """
-    pt0, _ = _get_proj_parameters(proj_metadata, pt0)
-
-    il0, _, _ = _calc.scene_to_image(proj_metadata, pt0)
-    proj_set_0 = _calc.compute_projection_sets(proj_metadata, il0)
+    pt0 = _get_scene_points(proj_metadata, pt0)
+    _, proj_set_0, geom_params = _compute_point_geometry(proj_metadata, pt0)
     assert isinstance(proj_set_0, params.ProjectionSetsBi)
-    assert proj_metadata.Xmt_Poly is not None
-    assert proj_metadata.Rcv_Poly is not None
-    geom_params = compute_proj_geom_params_bi(
-        proj_set_0, pt0, proj_metadata.Xmt_Poly, proj_metadata.Rcv_Poly
-    )
+    assert isinstance(geom_params, ProjGeomParamsBi)
+    return _pvt_sensitivity_matrices_bi(proj_metadata, proj_set_0, geom_params)
+
 
+def _pvt_sensitivity_matrices_bi(
+    proj_metadata: params.MetadataParams,
+    proj_set_0: params.ProjectionSetsBi,
+    geom_params: ProjGeomParamsBi,
+) -> PVTSensitivityMatricesBi:
+    """Bistatic PVT sensitivity matrices from precomputed projection geometry parameters"""
     # (1)
-    m_rrdot_delta_xmt = -0.5 * np.stack([geom_params.uXmt, geom_params.uXmtDot])
+    m_rrdot_delta_xmt = -0.5 * np.stack(
+        [geom_params.uXmt, geom_params.uXmtDot], axis=-2
+    )
 
     # (2)
     delta_tx_il0_coa = proj_set_0.tx_COA - proj_metadata.t_SCP_COA
     m_rrdot_delta_vxmt = -0.5 * np.stack(
         [
-            geom_params.uXmt * delta_tx_il0_coa,
-            geom_params.uXmt + geom_params.uXmtDot * delta_tx_il0_coa,
-        ]
+            geom_params.uXmt * delta_tx_il0_coa[..., np.newaxis],
+            geom_params.uXmt + geom_params.uXmtDot * delta_tx_il0_coa[..., np.newaxis],
+        ],
+        axis=-2,
     )
 
     # (3)
-    m_rrdot_xtf = (C / 2) * np.array(
-        [
-            [-geom_params.TRTX_0, proj_set_0.tx_COA - proj_metadata.t_SCP_COA],
-            [-geom_params.TRTXdot_0, 1],
-        ]
+    m_rrdot_xtf = (C / 2) * _stack_2x2(
+        -geom_params.TRTX_0,
+        delta_tx_il0_coa,
+        -geom_params.TRTXdot_0,
+        1.0,
     )
 
     # (4)
-    m_rrdot_delta_rcv = -0.5 * np.stack([geom_params.uRcv, geom_params.uRcvDot])
+    m_rrdot_delta_rcv = -0.5 * np.stack(
+        [geom_params.uRcv, geom_params.uRcvDot], axis=-2
+    )
 
     # (5)
     delta_tr_il0_coa = proj_set_0.tr_COA - proj_metadata.t_SCP_COA
     m_rrdot_delta_vrcv = -0.5 * np.stack(
         [
-            geom_params.uRcv * delta_tr_il0_coa,
-            geom_params.uRcv + geom_params.uRcvDot * delta_tr_il0_coa,
-        ]
+            geom_params.uRcv * delta_tr_il0_coa[..., np.newaxis],
+            geom_params.uRcv + geom_params.uRcvDot * delta_tr_il0_coa[..., np.newaxis],
+        ],
+        axis=-2,
     )
 
     # (6)
-    m_rrdot_rtf = (C / 2) * np.array(
-        [[+1, -(proj_set_0.tr_COA - proj_metadata.t_SCP_COA)], [0, -1]]
-    )
+    m_rrdot_rtf = (C / 2) * _stack_2x2(+1.0, -delta_tr_il0_coa, 0.0, -1.0)
 
     return PVTSensitivityMatricesBi(
         M_RRdot_delta_Xmt=m_rrdot_delta_xmt,
@@ -711,6 +860,7 @@ def compute_sensitivity_matrices(
     u_gpn0: npt.ArrayLike | None = None,
     delta_xrow: float | None = None,
     delta_ycol: float | None = None,
+    analytic: bool = False,
 ) -> SensitivityMatricesLike:
     """Compute the defined sensitivity matrices
 
@@ -718,36 +868,59 @@ def compute_sensitivity_matrices(
     ----------
     proj_metadata : MetadataParams
         Metadata parameters relevant to projection.
-    pt0 : array_like, optional
-        ECF scene point. Defaults to SCP.
-    u_gpn0 : array_like, optional
+    pt0 : (..., 3) array_like, optional
+        ECF scene points. Defaults to SCP.
+    u_gpn0 : (..., 3) array_like, optional
         unit normal to scene surface at pt0. Defaults to ETP normal at pt0.
     delta_xrow : float, optional
-        row coordinate increment (m).  Defaults to min(Row_SS, 1.0).
+        row coordinate increment (m) used when `analytic` is False.  Defaults to min(Row_SS, 1.0).
     delta_ycol : float, optional
-        col coordinate increment (m).  Defaults to min(Col_SS, 1.0).
+        col coordinate increment (m) used when `analytic` is False.  Defaults to min(Col_SS, 1.0).
+    analytic : bool, optional
+        If True, M_RRdot_IL is computed from analytic derivatives of the COA projection set.
+        Otherwise (default), it is approximated with finite differences over `delta_xrow` and `delta_ycol`.
 
     Returns
     -------
     SensitivityMatricesLike
+        Matrices with leading dimensions broadcast from `pt0` and `u_gpn0`.
+
+    Notes
+    -----
+    Each matrix is stored in the last two dimensions of its attribute; any leading dimensions correspond to the
+    scene points the matrices were computed for.
     """
 
-    pt0, u_gpn0 = _get_proj_parameters(proj_metadata, pt0, u_gpn0)
-    sp_mats = compute_slant_plane_sensitivity_matrices(proj_metadata, pt0, u_gpn0)
-    il_mats = compute_image_location_sensitivity_matrices(
-        proj_metadata, pt0, u_gpn0, delta_xrow, delta_ycol
+    pt0, u_gpn0, u_up0 = _get_proj_parameters(proj_metadata, pt0, u_gpn0)
+    il0, proj_set_0, geom_params = _compute_point_geometry(proj_metadata, pt0)
+    sp_mats = _slant_plane_sensitivity_matrices(
+        proj_metadata, u_gpn0, u_up0, geom_params
+    )
+    il_mats = _image_location_sensitivity_matrices(
+        proj_metadata,
+        il0,
+        proj_set_0,
+        geom_params,
+        sp_mats,
+        delta_xrow,
+        delta_ycol,
+        analytic,
     )
     pv_mats: PVTSensitivityMatricesMono | PVTSensitivityMatricesBi
     if proj_metadata.is_monostatic():
-        pv_mats = compute_pvt_sensitivity_matrices_mono(proj_metadata, pt0)
+        assert isinstance(proj_set_0, params.ProjectionSetsMono)
+        assert isinstance(geom_params, ProjGeomParamsMono)
+        pv_mats = _pvt_sensitivity_matrices_mono(proj_metadata, proj_set_0, geom_params)
         return SensitivityMatricesMono(
-            **dataclasses.asdict(sp_mats),
-            **dataclasses.asdict(il_mats),
-            **dataclasses.asdict(pv_mats),
+            **vars(sp_mats),
+            **vars(il_mats),
+            **vars(pv_mats),
         )
-    pv_mats = compute_pvt_sensitivity_matrices_bi(proj_metadata, pt0)
+    assert isinstance(proj_set_0, params.ProjectionSetsBi)
+    assert isinstance(geom_params, ProjGeomParamsBi)
+    pv_mats = _pvt_sensitivity_matrices_bi(proj_metadata, proj_set_0, geom_params)
     return SensitivityMatricesBi(
-        **dataclasses.asdict(sp_mats),
-        **dataclasses.asdict(il_mats),
-        **dataclasses.asdict(pv_mats),
+        **vars(sp_mats),
+        **vars(il_mats),
+        **vars(pv_mats),
     )
@@ -2,10 +2,11 @@
 Functions for interacting with SIDD XML
 """
 
+import functools
 import importlib.resources
 import numbers
 import pathlib
-from collections.abc import Sequence
+from collections.abc import Iterable, Sequence
 from typing import Any
 
 import lxml.etree
@@ -134,6 +135,24 @@ class XyzPolyType(skxt.XyzPolyType):
         super().__init__(child_ns=NSMAP["sicommon"])
 
 
+@functools.lru_cache(maxsize=64)
+def _tag_namespace(tag: str) -> str | None:
+    """Return the namespace URI of a ``{namespace}localname`` tag, like ``lxml.etree.QName(tag).namespace``"""
+    return tag[1 : tag.index("}")] if tag.startswith("{") else None
+
+
+def _extend_from_xml(
+    elem: lxml.etree.Element, ns: str | None, children_xml: Iterable[str]
+) -> None:
+    """Append the serialized ``children_xml`` elements, in namespace ``ns``, to ``elem``.
+
+    Parsing the children in a single call is much faster than creating them one at a time
+    when there are many of them.
+    """
+    xmlns = f' xmlns="{ns}"' if ns else ""
+    elem.extend(lxml.etree.fromstring(f"<_{xmlns}>{''.join(children_xml)}</_>"))
+
+
 class FilterCoefficientType(skxt.Type):
     """
     Transcoder for FilterCoefficients.
@@ -178,15 +197,16 @@ class FilterCoefficientType(skxt.Type):
 
         """
         shape = (int(elem.get(self.size_x_name)), int(elem.get(self.size_y_name)))
+        num_coefs = len(elem)
+        x_indices = np.fromiter(
+            (int(coef.get(self.coef_x_name)) for coef in elem), np.intp, num_coefs
+        )
+        y_indices = np.fromiter(
+            (int(coef.get(self.coef_y_name)) for coef in elem), np.intp, num_coefs
+        )
+        values = np.fromiter((float(coef.text) for coef in elem), np.float64, num_coefs)
         coefs = np.zeros(shape, np.float64)
-        coef_by_indices = {
-            (int(coef.get(self.coef_x_name)), int(coef.get(self.coef_y_name))): float(
-                coef.text
-            )
-            for coef in elem
-        }
-        for indices, coef in coef_by_indices.items():
-            coefs[*indices] = coef
+        coefs[x_indices, y_indices] = values
         return coefs
 
     def set_elem(self, elem: lxml.etree.Element, val: npt.ArrayLike) -> None:
@@ -203,17 +223,19 @@ class FilterCoefficientType(skxt.Type):
         coefs = np.asarray(val)
         if coefs.ndim != 2:
             raise ValueError("Filter coefficient array must be 2-dimensional")
-        elem[:] = []
-        elem_ns = self.child_ns if self.child_ns else lxml.etree.QName(elem).namespace
-        ns = f"{{{elem_ns}}}" if elem_ns else ""
+        del elem[:]
+        elem_ns = self.child_ns if self.child_ns else _tag_namespace(elem.tag)
         elem.set(self.size_x_name, str(coefs.shape[0]))
         elem.set(self.size_y_name, str(coefs.shape[1]))
-        for coord, coef in np.ndenumerate(coefs):
-            attribs = {
-                self.coef_x_name: str(coord[0]),
-                self.coef_y_name: str(coord[1]),
-            }
-            lxml.etree.SubElement(elem, ns + "Coef", attrib=attribs).text = str(coef)
+        _extend_from_xml(
+            elem,
+            elem_ns,
+            (
+                f'<Coef {self.coef_x_name}="{x}" {self.coef_y_name}="{y}">{coef}</Coef>'
+                for x, row in enumerate(coefs.tolist())
+                for y, coef in enumerate(row)
+            ),
+        )
         self.parse_elem(elem)  # make sure result is parsable
 
 
@@ -225,14 +247,16 @@ class IntListType(skxt.Type):
 
     def parse_elem(self, elem: lxml.etree.Element) -> npt.NDArray:
         """Returns space-separated ints as ndarray of ints"""
-        val = "" if elem.text is None else elem.text
-        return np.array([int(tok) for tok in val.split(" ")], dtype=int)
+        tokens = ("" if elem.text is None else elem.text).split()
+        if not tokens:
+            raise ValueError("list of ints must not be empty")
+        return np.array(tokens, dtype=int)
 
     def set_elem(
         self, elem: lxml.etree.Element, val: Sequence[numbers.Integral]
     ) -> None:
         """Sets ``elem`` node using the list of integers in ``val``."""
-        elem.text = " ".join([str(entry) for entry in val])
+        elem.text = " ".join(map(str, np.asarray(val).tolist()))
         self.parse_elem(elem)  # make sure result is parsable
 
 
@@ -257,11 +281,12 @@ class Lookup3TableType(skxt.Type):
 
     def parse_elem(self, elem: lxml.etree.Element) -> npt.NDArray:
         """Returns space-separated comma-separated triplets of ints as ndarray of ints"""
-        val = "" if elem.text is None else elem.text
-        retval = []
-        for triplet in val.split(" "):
-            retval.append([int(x) for x in triplet.split(",")])
-        return np.array(retval, dtype=int)
+        triplets = ("" if elem.text is None else elem.text).split()
+        if not triplets:
+            raise ValueError("list of int triplets must not be empty")
+        return np.array(
+            [[int(x) for x in triplet.split(",")] for triplet in triplets], dtype=int
+        )
 
     def set_elem(
         self, elem: lxml.etree.Element, val: Sequence[Sequence[numbers.Integral]]
@@ -272,6 +297,9 @@ class Lookup3TableType(skxt.Type):
         self.parse_elem(elem)  # make sure result is parsable
 
 
+_ICP_LABELS = ("1:FRFC", "2:FRLC", "3:LRLC", "4:LRFC")
+
+
 class ImageCornersType(skxt.NdArrayType):
     """
     Transcoder for GeoData/ImageCorners XML parameter types.
@@ -296,12 +324,13 @@ class ImageCornersType(skxt.NdArrayType):
             Array of [latitude (deg), longitude (deg)] image corners.
 
         """
-        return np.asarray(
-            [
-                self.sub_type.parse_elem(x)
-                for x in sorted(elem, key=lambda x: x.get("index"))
-            ]
-        )
+        icps_by_index = {x.get("index"): x for x in elem}
+        icps = []
+        for label in _ICP_LABELS:
+            if label not in icps_by_index:
+                raise ValueError(f"ImageCorners missing ICP index {label!r}")
+            icps.append(self.sub_type.parse_elem(icps_by_index[label]))
+        return np.asarray(icps)
 
     def set_elem(
         self, elem: lxml.etree.Element, val: Sequence[Sequence[float]]
@@ -316,11 +345,10 @@ class ImageCornersType(skxt.NdArrayType):
             Array of [latitude (deg), longitude (deg)] image corners.
 
         """
-        elem[:] = []
-        labels = ("1:FRFC", "2:FRLC", "3:LRLC", "4:LRFC")
-        icp_ns = lxml.etree.QName(elem).namespace
+        del elem[:]
+        icp_ns = _tag_namespace(elem.tag)
         icp_ns = f"{{{icp_ns}}}" if icp_ns else ""
-        for label, coord in zip(labels, val):
+        for label, coord in zip(_ICP_LABELS, val):
             icp = lxml.etree.SubElement(
                 elem, icp_ns + self.sub_tag, attrib={"index": label}
             )
@@ -369,32 +397,31 @@ class SfaPointType(skxt.ArrayType):
     """
 
     def __init__(self) -> None:
-        self._subelem_superset: dict[str, skxt.Type] = {
-            c: skxt.DblType() for c in ("X", "Y", "Z")
+        subelements: dict[str, skxt.Type] = {c: skxt.DblType() for c in ("X", "Y", "Z")}
+        super().__init__(subelements=subelements, child_ns="urn:SFA:1.2.0")
+        # fixed 2D/3D point transcoders so that parsing/setting does not modify self
+        self._point_types = {
+            ndim: skxt.ArrayType(
+                subelements=dict(list(subelements.items())[:ndim]),
+                child_ns=self.child_ns,
+            )
+            for ndim in (2, 3)
         }
-        super().__init__(subelements=self._subelem_superset, child_ns="urn:SFA:1.2.0")
 
     def parse_elem(self, elem: lxml.etree.Element) -> npt.NDArray:
         """Returns an array containing the sub-elements encoded in ``elem``."""
-        if len(elem) not in (2, 3):
+        if len(elem) not in self._point_types:
             raise ValueError("Unexpected number of subelements (requires 2 or 3)")
-        self.subelements = {
-            k: v
-            for idx, (k, v) in enumerate(self._subelem_superset.items())
-            if idx < len(elem)
-        }
-        return super().parse_elem(elem)
+        return self._point_types[len(elem)].parse_elem(elem)
 
     def set_elem(self, elem: lxml.etree.Element, val: Sequence[Any]) -> None:
         """Set ``elem`` node using ``val``."""
-        if len(val) not in (2, 3):
+        if len(val) not in self._point_types:
             raise ValueError("Unexpected number of values (requires 2 or 3)")
-        self.subelements = {
-            k: v
-            for idx, (k, v) in enumerate(self._subelem_superset.items())
-            if idx < len(val)
-        }
-        super().set_elem(elem, val)
+        self._point_types[len(val)].set_elem(elem, val)
+
+
+_INT_LIST_TYPE = IntListType()
 
 
 class LUTInfoType(skxt.Type):
@@ -407,7 +434,7 @@ class LUTInfoType(skxt.Type):
         """Returns an array containing the LUTs encoded in ``elem``."""
         return np.array(
             [
-                IntListType().parse_elem(x)
+                _INT_LIST_TYPE.parse_elem(x)
                 for x in sorted(elem, key=lambda x: int(x.get("lut")))
             ]
         )
@@ -423,19 +450,87 @@ class LUTInfoType(skxt.Type):
             (numLuts, size)-shaped array of LUTs to set
 
         """
-        elem[:] = []
-        elem_ns = lxml.etree.QName(elem).namespace
-        ns = f"{{{elem_ns}}}" if elem_ns else ""
+        del elem[:]
         luts = np.asarray(val)
         elem.set("numLuts", str(luts.shape[0]))
         elem.set("size", str(luts.shape[1]))
-        for index, sub_val in enumerate(luts):
-            subelem = lxml.etree.SubElement(elem, ns + "LUTValues")
-            IntListType().set_elem(subelem, sub_val)
-            subelem.set("lut", str(index + 1))
+        _extend_from_xml(
+            elem,
+            _tag_namespace(elem.tag),
+            (
+                f'<LUTValues lut="{index + 1}">{" ".join(map(str, lut))}</LUTValues>'
+                for index, lut in enumerate(luts.tolist())
+            ),
+        )
         self.parse_elem(elem)  # make sure result is parsable
 
 
+# Transcoder lookup tables are static, so they are built once at import and shared by all XsdHelpers
+_TXT_TYPE = TxtType()
+_LOCAL_XDT_TYPE = skxt.XdtType(force_utc=False)
+_KNOWN_BUILTINS = {
+    "{http://www.w3.org/2001/XMLSchema}string": _TXT_TYPE,
+    "{http://www.w3.org/2001/XMLSchema}dateTime": XdtType(),
+    "{http://www.w3.org/2001/XMLSchema}int": IntType(),
+    "{http://www.w3.org/2001/XMLSchema}double": DblType(),
+    "{http://www.w3.org/2001/XMLSchema}boolean": BoolType(),
+}
+_SIDD_1 = {
+    "{urn:SICommon:0.1}AngleMagnitudeType": AngleMagnitudeType(
+        child_ns="urn:SICommon:0.1"
+    ),
+    "{urn:SICommon:0.1}LatLonVertexType": skxt.LatLonType(child_ns="urn:SICommon:0.1"),
+    "{urn:SICommon:0.1}ParameterType": ParameterType(),
+    "{urn:SICommon:0.1}Poly1DType": skxt.PolyType(child_ns="urn:SICommon:0.1"),
+    "{urn:SICommon:0.1}Poly2DType": skxt.Poly2dType(child_ns="urn:SICommon:0.1"),
+    "{urn:SICommon:0.1}RangeAzimuthType": RangeAzimuthType(child_ns="urn:SICommon:0.1"),
+    "{urn:SICommon:0.1}RowColDoubleType": RowColDblType(child_ns="urn:SICommon:0.1"),
+    "{urn:SICommon:0.1}RowColIntType": skxt.RowColType(child_ns="urn:SICommon:0.1"),
+    "{urn:SICommon:0.1}XYZPolyType": skxt.XyzPolyType(child_ns="urn:SICommon:0.1"),
+    "{urn:SICommon:0.1}XYZType": skxt.XyzType(child_ns="urn:SICommon:0.1"),
+    "{urn:SIDD:1.0.0}FootprintType": skxt.NdArrayType(
+        "Vertex", skxt.LatLonType(child_ns="urn:SICommon:0.1")
+    ),
+    "{urn:SIDD:1.0.0}Lookup3TableType": Lookup3TableType(),
+    "{urn:SIDD:1.0.0}LookupTableType": LookupTableType(),
+}
+_SIDD_2_AND_3 = {
+    "{urn:SFA:1.2.0}PointType": SfaPointType(),
+    "{urn:SICommon:1.0}AngleMagnitudeType": AngleMagnitudeType(),
+    "{urn:SICommon:1.0}AngleZeroToExclusive360MagnitudeType": AngleMagnitudeType(),
+    "{urn:SICommon:1.0}LatLonRestrictionType": LatLonType(),
+    "{urn:SICommon:1.0}LatLonType": LatLonType(),
+    "{urn:SICommon:1.0}LatLonVertexType": LatLonType(),
+    "{urn:SICommon:1.0}LineType": skxt.NdArrayType("Endpoint", LatLonType()),
+    "{urn:SICommon:1.0}ParameterType": ParameterType(),
+    "{urn:SICommon:1.0}Poly1DType": PolyCoef1dType(),
+    "{urn:SICommon:1.0}Poly2DType": PolyCoef2dType(),
+    "{urn:SICommon:1.0}PolygonType": skxt.NdArrayType("Vertex", LatLonType()),
+    "{urn:SICommon:1.0}RangeAzimuthType": RangeAzimuthType(),
+    "{urn:SICommon:1.0}RowColDoubleType": RowColDblType(),
+    "{urn:SICommon:1.0}RowColIntType": RowColIntType(),
+    "{urn:SICommon:1.0}RowColVertexType": RowColIntType(),
+    "{urn:SICommon:1.0}XYZPolyType": XyzPolyType(),
+    "{urn:SICommon:1.0}XYZType": XyzType(),
+    "<UNNAMED>-{urn:SICommon:1.0}LineType/{urn:SICommon:1.0}Endpoint": LatLonType(),
+    "<UNNAMED>-{urn:SICommon:1.0}PolygonType/{urn:SICommon:1.0}Vertex": LatLonType(),
+    "{urn:SIDD:3.0.0}FilterBankCoefType": FilterCoefficientType("phasingpoint"),
+    "{urn:SIDD:3.0.0}FilterKernelCoefType": FilterCoefficientType("rowcol"),
+    "{urn:SIDD:3.0.0}ImageCornersType": ImageCornersType(),
+    "{urn:SIDD:3.0.0}LookupTableType": _INT_LIST_TYPE,
+    "{urn:SIDD:3.0.0}LUTInfoType": LUTInfoType(),
+    "{urn:SIDD:3.0.0}PolygonType": skxt.NdArrayType("Vertex", LatLonType()),
+    "{urn:SIDD:3.0.0}ValidDataType": skxt.NdArrayType("Vertex", RowColIntType()),
+    "<UNNAMED>-{urn:SIDD:3.0.0}ImageCornersType/{urn:SIDD:3.0.0}ICP": LatLonType(),
+}
+_SIDD_2_AND_3 |= {
+    k.replace("urn:SIDD:3.0.0", "urn:SIDD:2.0.0"): v
+    for k, v in _SIDD_2_AND_3.items()
+    if "urn:SIDD:3.0.0" in k
+}
+_SUPPORTED_TYPES = _SIDD_1 | _SIDD_2_AND_3
+
+
 class XmlHelper(skxml.XmlHelper):
     """
     :py:class:`~sarkit.xmlhelp.XmlHelper` for SIDD
@@ -463,112 +558,15 @@ class XsdHelper(skxml.XsdHelper):
 
     def get_transcoder(self, typename, tag=None):
         """Return the appropriate transcoder given the typename (and optionally tag)."""
-        known_builtins = {
-            "{http://www.w3.org/2001/XMLSchema}string": TxtType(),
-            "{http://www.w3.org/2001/XMLSchema}dateTime": XdtType(),
-            "{http://www.w3.org/2001/XMLSchema}int": IntType(),
-            "{http://www.w3.org/2001/XMLSchema}double": DblType(),
-            "{http://www.w3.org/2001/XMLSchema}boolean": BoolType(),
-        }
         typedef = self.xsdtypes[typename]
-        sidd_1 = {
-            "{urn:SICommon:0.1}AngleMagnitudeType": AngleMagnitudeType(
-                child_ns="urn:SICommon:0.1"
-            ),
-            "{urn:SICommon:0.1}LatLonVertexType": skxt.LatLonType(
-                child_ns="urn:SICommon:0.1"
-            ),
-            "{urn:SICommon:0.1}ParameterType": ParameterType(),
-            "{urn:SICommon:0.1}Poly1DType": skxt.PolyType(child_ns="urn:SICommon:0.1"),
-            "{urn:SICommon:0.1}Poly2DType": skxt.Poly2dType(
-                child_ns="urn:SICommon:0.1"
-            ),
-            "{urn:SICommon:0.1}RangeAzimuthType": RangeAzimuthType(
-                child_ns="urn:SICommon:0.1"
-            ),
-            "{urn:SICommon:0.1}RowColDoubleType": RowColDblType(
-                child_ns="urn:SICommon:0.1"
-            ),
-            "{urn:SICommon:0.1}RowColIntType": skxt.RowColType(
-                child_ns="urn:SICommon:0.1"
-            ),
-            "{urn:SICommon:0.1}XYZPolyType": skxt.XyzPolyType(
-                child_ns="urn:SICommon:0.1"
-            ),
-            "{urn:SICommon:0.1}XYZType": skxt.XyzType(child_ns="urn:SICommon:0.1"),
-            "{urn:SIDD:1.0.0}FootprintType": skxt.NdArrayType(
-                "Vertex", skxt.LatLonType(child_ns="urn:SICommon:0.1")
-            ),
-            "{urn:SIDD:1.0.0}Lookup3TableType": Lookup3TableType(),
-            "{urn:SIDD:1.0.0}LookupTableType": LookupTableType(),
-        }
-        sidd_2_and_3 = {
-            "{urn:SFA:1.2.0}PointType": SfaPointType(),
-            "{urn:SICommon:1.0}AngleMagnitudeType": AngleMagnitudeType(),
-            "{urn:SICommon:1.0}AngleZeroToExclusive360MagnitudeType": AngleMagnitudeType(),
-            "{urn:SICommon:1.0}LatLonRestrictionType": LatLonType(),
-            "{urn:SICommon:1.0}LatLonType": LatLonType(),
-            "{urn:SICommon:1.0}LatLonVertexType": LatLonType(),
-            "{urn:SICommon:1.0}LineType": skxt.NdArrayType("Endpoint", LatLonType()),
-            "{urn:SICommon:1.0}ParameterType": ParameterType(),
-            "{urn:SICommon:1.0}Poly1DType": PolyCoef1dType(),
-            "{urn:SICommon:1.0}Poly2DType": PolyCoef2dType(),
-            "{urn:SICommon:1.0}PolygonType": skxt.NdArrayType("Vertex", LatLonType()),
-            "{urn:SICommon:1.0}RangeAzimuthType": RangeAzimuthType(),
-            "{urn:SICommon:1.0}RowColDoubleType": RowColDblType(),
-            "{urn:SICommon:1.0}RowColIntType": RowColIntType(),
-            "{urn:SICommon:1.0}RowColVertexType": RowColIntType(),
-            "{urn:SICommon:1.0}XYZPolyType": XyzPolyType(),
-            "{urn:SICommon:1.0}XYZType": XyzType(),
-            "<UNNAMED>-{urn:SICommon:1.0}LineType/{urn:SICommon:1.0}Endpoint": LatLonType(),
-            "<UNNAMED>-{urn:SICommon:1.0}PolygonType/{urn:SICommon:1.0}Vertex": LatLonType(),
-            "{urn:SIDD:3.0.0}FilterBankCoefType": FilterCoefficientType("phasingpoint"),
-            "{urn:SIDD:3.0.0}FilterKernelCoefType": FilterCoefficientType("rowcol"),
-            "{urn:SIDD:3.0.0}ImageCornersType": ImageCornersType(),
-            "{urn:SIDD:3.0.0}LookupTableType": IntListType(),
-            "{urn:SIDD:3.0.0}LUTInfoType": LUTInfoType(),
-            "{urn:SIDD:3.0.0}PolygonType": skxt.NdArrayType("Vertex", LatLonType()),
-            "{urn:SIDD:3.0.0}ValidDataType": skxt.NdArrayType(
-                "Vertex", RowColIntType()
-            ),
-            "<UNNAMED>-{urn:SIDD:3.0.0}ImageCornersType/{urn:SIDD:3.0.0}ICP": LatLonType(),
-        }
-        sidd_2_and_3["{urn:SIDD:2.0.0}FilterBankCoefType"] = sidd_2_and_3[
-            "{urn:SIDD:3.0.0}FilterBankCoefType"
-        ]
-        sidd_2_and_3["{urn:SIDD:2.0.0}FilterKernelCoefType"] = sidd_2_and_3[
-            "{urn:SIDD:3.0.0}FilterKernelCoefType"
-        ]
-        sidd_2_and_3["{urn:SIDD:2.0.0}ImageCornersType"] = sidd_2_and_3[
-            "{urn:SIDD:3.0.0}ImageCornersType"
-        ]
-        sidd_2_and_3["{urn:SIDD:2.0.0}LookupTableType"] = sidd_2_and_3[
-            "{urn:SIDD:3.0.0}LookupTableType"
-        ]
-        sidd_2_and_3["{urn:SIDD:2.0.0}LUTInfoType"] = sidd_2_and_3[
-            "{urn:SIDD:3.0.0}LUTInfoType"
-        ]
-        sidd_2_and_3["{urn:SIDD:2.0.0}PolygonType"] = sidd_2_and_3[
-            "{urn:SIDD:3.0.0}PolygonType"
-        ]
-        sidd_2_and_3["{urn:SIDD:2.0.0}ValidDataType"] = sidd_2_and_3[
-            "{urn:SIDD:3.0.0}ValidDataType"
-        ]
-        sidd_2_and_3[
-            "<UNNAMED>-{urn:SIDD:2.0.0}ImageCornersType/{urn:SIDD:2.0.0}ICP"
-        ] = sidd_2_and_3[
-            "<UNNAMED>-{urn:SIDD:3.0.0}ImageCornersType/{urn:SIDD:3.0.0}ICP"
-        ]
-        supported_types = sidd_1 | sidd_2_and_3
-
         if tag in ("{urn:SIDD:2.0.0}LocalDateTime", "{urn:SIDD:3.0.0}LocalDateTime"):
-            return skxt.XdtType(force_utc=False)
+            return _LOCAL_XDT_TYPE
         if typename.startswith("{http://www.w3.org/2001/XMLSchema}"):
-            return known_builtins[typename]
-        if typename in supported_types:
-            return supported_types[typename]
+            return _KNOWN_BUILTINS[typename]
+        if typename in _SUPPORTED_TYPES:
+            return _SUPPORTED_TYPES[typename]
         if not typedef.children:
-            return known_builtins.get(typedef.text_typename, TxtType())
+            return _KNOWN_BUILTINS.get(typedef.text_typename, _TXT_TYPE)
         return None
 
 
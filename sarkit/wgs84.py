@@ -258,10 +258,11 @@ def up(latlonhae: npt.ArrayLike) -> npt.NDArray[np.float64]:
     latlonhae = np.asarray(latlonhae)
     lat = np.deg2rad(latlonhae[..., 0])
     lon = np.deg2rad(latlonhae[..., 1])
+    cos_lat = np.cos(lat)
     return np.stack(
         [
-            np.cos(lat) * np.cos(lon),
-            np.cos(lat) * np.sin(lon),
+            cos_lat * np.cos(lon),
+            cos_lat * np.sin(lon),
             np.sin(lat),
         ],
         axis=-1,
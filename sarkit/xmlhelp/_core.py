@@ -1,13 +1,21 @@
 import abc
 import collections.abc
 import dataclasses
+import functools
 import json
 import re
+from typing import Any
 
 import lxml.etree
 import numpy.testing as npt
 
 
+@functools.lru_cache(maxsize=4096)
+def _localname(tag: str) -> str:
+    """Return the localname of a (possibly namespace-qualified) tag."""
+    return lxml.etree.QName(tag).localname
+
+
 @dataclasses.dataclass
 class ChildDef:
     """XSD child element definition"""
@@ -25,27 +33,46 @@ class XsdTypeDef:
     children: list[ChildDef] = dataclasses.field(default_factory=list)
     text_typename: str | None = None
 
+    # lookup indices are built on first use; type definitions are not modified after loading
+    @functools.cached_property
+    def _childdefs_by_tag(self) -> dict[str, ChildDef]:
+        index: dict[str, ChildDef] = {}
+        for cdef in self.children:
+            index.setdefault(cdef.tag, cdef)
+        return index
+
+    @functools.cached_property
+    def _childdef_positions(self) -> dict[str, list[int]]:
+        index: dict[str, list[int]] = {}
+        for pos, cdef in enumerate(self.children):
+            index.setdefault(cdef.tag, []).append(pos)
+        return index
+
+    @functools.cached_property
+    def _childdefs_by_localname(self) -> dict[str, ChildDef]:
+        index: dict[str, ChildDef] = {}
+        for cdef in self.children:
+            index.setdefault(_localname(cdef.tag), cdef)
+        return index
+
+    @functools.cached_property
+    def _attributes_by_localname(self) -> dict[str, str]:
+        index: dict[str, str] = {}
+        for attrib in self.attributes:
+            index.setdefault(_localname(attrib), attrib)
+        return index
+
     def get_childdef(self, tag) -> ChildDef | None:
         """Return the first ChildDef in children whose tag matches tag."""
-        return next((cdef for cdef in self.children if cdef.tag == tag), None)
+        return self._childdefs_by_tag.get(tag)
 
     def get_childdef_from_localname(self, localname: str) -> ChildDef | None:
         """Return the `ChildDef` in ``children`` by localname (e.g. no namespace) or ``None``."""
-        return next(
-            (
-                cdef
-                for cdef in self.children
-                if lxml.etree.QName(cdef.tag).localname == localname
-            ),
-            None,
-        )
+        return self._childdefs_by_localname.get(localname)
 
     def get_attribute_from_localname(self, localname: str) -> str | None:
         """Return attribute by localname (e.g. no namespace) or ``None``."""
-        for attrib in self.attributes:
-            if lxml.etree.QName(attrib).localname == localname:
-                return attrib
-        return None
+        return self._attributes_by_localname.get(localname)
 
 
 def dumps_xsdtypes(xsdtypes):
@@ -88,11 +115,23 @@ class XsdHelper(abc.ABC):
     ----------
     root_ns : str
         Target namespace of the schema document
+
+    Notes
+    -----
+    ``xsdtypes`` is parsed once per helper class and namespace, and the same dictionary is shared by every such helper.
+    Changes to it are visible to all of them. `XsdTypeDef` lookups are indexed on first use, so replace a type
+    definition rather than editing its ``children`` or ``attributes`` in place.
     """
 
+    _xsdtypes_cache: dict[tuple[type, str], dict] = {}
+
     def __init__(self, root_ns: str):
-        xsdtypes_json_str = self._read_xsdtypes_json(root_ns)
-        self.xsdtypes = loads_xsdtypes(xsdtypes_json_str)
+        cache_key = (type(self), root_ns)
+        if cache_key not in self._xsdtypes_cache:
+            xsdtypes_json_str = self._read_xsdtypes_json(root_ns)
+            self._xsdtypes_cache[cache_key] = loads_xsdtypes(xsdtypes_json_str)
+        self.xsdtypes = self._xsdtypes_cache[cache_key]
+        self._transcoder_cache: dict[tuple[str, str | None], Any] = {}
 
     @abc.abstractmethod
     def _read_xsdtypes_json(self, root_ns: str) -> str:
@@ -120,9 +159,16 @@ class XsdHelper(abc.ABC):
     def get_transcoder(self, typename, tag=None):
         """Return the appropriate transcoder given the typename (and optionally tag)."""
 
+    def _cached_transcoder(self, typename, tag=None):
+        """Return `get_transcoder` for (typename, tag), resolving each pair once per helper."""
+        key = (typename, tag)
+        if key not in self._transcoder_cache:
+            self._transcoder_cache[key] = self.get_transcoder(typename, tag)
+        return self._transcoder_cache[key]
+
     def get_elem_transcoder(self, elem: lxml.etree.Element):
         """Return the appropriate transcoder given an element."""
-        return self.get_transcoder(self.get_elem_typeinfo(elem)[0], tag=elem.tag)
+        return self._cached_transcoder(self.get_elem_typeinfo(elem)[0], tag=elem.tag)
 
 
 class _UNSET:
@@ -287,7 +333,7 @@ class ElementWrapper(collections.abc.MutableMapping):
         """Retrieve a transcoded value (leaf) or wrapped element (branch) from a subelement."""
         childdef = self.typedef.get_childdef_from_localname(subelem_localname)
         elempath = self.elementpath + f"/{childdef.tag}"
-        transcoder = self.xsdhelper.get_transcoder(childdef.typename, childdef.tag)
+        transcoder = self.xsdhelper._cached_transcoder(childdef.typename, childdef.tag)
         if transcoder is None or subelem is None:
             return ElementWrapper(
                 subelem,
@@ -306,13 +352,17 @@ class ElementWrapper(collections.abc.MutableMapping):
 
     def _get_inserter(self, childtag):
         """Return a function that inserts the child element in the appropriate location."""
+        # insert before the first existing element of the earliest later child definition
+        positions = self.typedef._childdef_positions
+        childtag_pos = positions[childtag][-1]
         successor = None
-        for child in reversed(self.typedef.children):
-            if child.tag == childtag:
-                break
-            this_child = self.elem.find(child.tag)
-            if this_child is not None:
-                successor = this_child
+        successor_pos = len(self.typedef.children)
+        for this_child in self.elem:
+            pos = next(
+                (p for p in positions.get(this_child.tag, ()) if p > childtag_pos), None
+            )
+            if pos is not None and pos < successor_pos:
+                successor, successor_pos = this_child, pos
 
         appendfunc = self.elem.append if successor is None else successor.addprevious
         return appendfunc
@@ -330,7 +380,7 @@ class ElementWrapper(collections.abc.MutableMapping):
 
         childdef = self._getchilddef(localname)
 
-        transcoder = self.xsdhelper.get_transcoder(childdef.typename, childdef.tag)
+        transcoder = self.xsdhelper._cached_transcoder(childdef.typename, childdef.tag)
 
         def _val_to_elem(val):
             if isinstance(val, lxml.etree._Element):
@@ -405,13 +455,13 @@ class ElementWrapper(collections.abc.MutableMapping):
         keys = []
         if self.elem is not None:
             for attribname in self.elem.keys():
-                localname = lxml.etree.QName(attribname).localname
+                localname = _localname(attribname)
                 if self.typedef.get_attribute_from_localname(localname) is not None:
                     keys.append("@" + localname)
 
             keys.sort()
             for subelem in self.elem:
-                localname = lxml.etree.QName(subelem).localname
+                localname = _localname(subelem.tag)
                 if localname not in keys and (
                     self.typedef.get_childdef_from_localname(localname) is not None
                 ):
@@ -428,10 +478,13 @@ class ElementWrapper(collections.abc.MutableMapping):
         # Make sure localname is valid
         if localname.startswith("@"):
             _ = self._getattribname(localname)
-        else:
-            _ = self._getchilddef(localname)
+            attrib_localname = localname.removeprefix("@")
+            return any(_localname(x) == attrib_localname for x in self.elem.keys())
 
-        return localname in self._keys()
+        _ = self._getchilddef(localname)
+        if self.elem is None:
+            return False
+        return self.elem.find("{*}" + localname) is not None
 
     def to_dict(self) -> dict:
         """Recursively convert the ElementWrapper to a dictionary."""
@@ -439,11 +492,37 @@ class ElementWrapper(collections.abc.MutableMapping):
         def convert(v):
             if isinstance(v, ElementWrapper):
                 return v.to_dict()
-            if isinstance(v, tuple):
-                return tuple(map(convert, v))
             return v
 
-        return {k: convert(v) for k, v in self.items()}
+        result: dict[str, Any] = {}
+        if self.elem is None:
+            return result
+        attribs: dict[str, str] = {}
+        for attribname in self.elem.keys():
+            localname = _localname(attribname)
+            if self.typedef.get_attribute_from_localname(localname) is not None:
+                attribs["@" + localname] = self.elem.get(attribname)
+        # sort on the "@localname" keys, as _keys() does
+        result.update(sorted(attribs.items()))
+
+        # group the children by localname in a single pass instead of a find per key
+        subelems_by_localname: dict[str, tuple[ChildDef, list]] = {}
+        for subelem in self.elem:
+            localname = _localname(subelem.tag)
+            if localname in subelems_by_localname:
+                subelems_by_localname[localname][1].append(subelem)
+            elif childdef := self.typedef.get_childdef_from_localname(localname):
+                subelems_by_localname[localname] = (childdef, [subelem])
+        for localname, (childdef, subelems) in subelems_by_localname.items():
+            if childdef.repeat:
+                result[localname] = tuple(
+                    convert(self._handle_subelem(x, localname)) for x in subelems
+                )
+            else:
+                result[localname] = convert(
+                    self._handle_subelem(subelems[0], localname)
+                )
+        return result
 
     def from_dict(self, val):
         """Populate the ElementWrapper with the contents of a dictionary.
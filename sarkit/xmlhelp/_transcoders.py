@@ -57,6 +57,9 @@ class TxtType(Type):
         self.parse_elem(elem)  # make sure result is parsable
 
 
+_TXT_TYPE = TxtType()
+
+
 class EnuType(TxtType):
     """Transcoder for enumeration (ENU) XML parameter types.
 
@@ -70,17 +73,24 @@ class BoolType(Type):
 
     """
 
+    _FROM_TEXT = {"0": False, "false": False, "1": True, "true": True}
+    _TO_TEXT = {False: "false", True: "true"}
+
     def parse_elem(self, elem: lxml.etree.Element) -> bool:
         """Returns a Boolean value constructed from the string ``elem.text``."""
         val_collapsed = elem.text.strip()
-        if val_collapsed in ("0", "false"):
-            return False
-        if val_collapsed in ("1", "true"):
-            return True
-        raise ValueError(f"{val_collapsed} is not in xs:boolean's lexical space")
+        try:
+            return self._FROM_TEXT[val_collapsed]
+        except KeyError:
+            raise ValueError(
+                f"{val_collapsed} is not in xs:boolean's lexical space"
+            ) from None
 
     def set_elem(self, elem: lxml.etree.Element, val: bool) -> None:
         """Set ``elem.text`` to a string representation of the boolean ``val``."""
+        if isinstance(val, (bool, np.bool_)):
+            elem.text = self._TO_TEXT[bool(val)]
+            return
         elem.text = str(val).lower()
         self.parse_elem(elem)  # make sure result is parsable
 
@@ -159,12 +169,13 @@ class XdtType(Type):
         """Set ``elem.text`` to a string representation of the date and time from ``val``."""
         is_aware = val.tzinfo is not None and val.tzinfo.utcoffset(None) is not None
 
-        format_str = "%Y-%m-%dT%H:%M:%S.%f"
+        suffix = ""
         if self.force_utc or (is_aware and not val.utcoffset()):
-            format_str += "Z"
+            suffix = "Z"
         if self.force_utc and is_aware:
             val = val.astimezone(datetime.UTC)
-        elem.text = val.strftime(format_str)
+        # the UTC offset is written separately, as "Z" or not at all
+        elem.text = val.replace(tzinfo=None).isoformat(timespec="microseconds") + suffix
         self.parse_elem(elem)  # make sure result is parsable
 
 
@@ -200,15 +211,16 @@ class PolyNdType(Type):
             the term of multi-exponent n_1, n_2, ..., n_nvar is contained in ``val[n_1, n_2, ..., n_nvar]``.
 
         """
-        coef_by_exponents = {
-            tuple(
-                int(coef.get(f"exponent{x}")) for x in range(1, self.nvar + 1)
-            ): float(coef.text)
-            for coef in elem
-        }
-        coefs = np.zeros(np.max(list(coef_by_exponents), axis=0) + 1, np.float64)
-        for exponents, coef in coef_by_exponents.items():
-            coefs[*exponents] = coef
+        exponent_attrs = [f"exponent{x}" for x in range(1, self.nvar + 1)]
+        exponents = np.array(
+            [[int(coef.get(attr)) for attr in exponent_attrs] for coef in elem],
+            dtype=np.intp,
+        ).reshape(-1, self.nvar)
+        values = np.fromiter(
+            (float(coef.text) for coef in elem), np.float64, count=exponents.shape[0]
+        )
+        coefs = np.zeros(np.max(exponents, axis=0) + 1, np.float64)
+        coefs[tuple(exponents.T)] = values
         return coefs
 
     def set_elem(self, elem: lxml.etree.Element, val: npt.ArrayLike) -> None:
@@ -231,9 +243,11 @@ class PolyNdType(Type):
         ns = f"{{{elem_ns}}}" if elem_ns else ""
         for dim, ncoef in enumerate(coefs.shape):
             elem.set(f"order{dim + 1}", str(ncoef - 1))
-        for coord, coef in np.ndenumerate(coefs):
-            attribs = {f"exponent{d + 1}": str(c) for d, c in enumerate(coord)}
-            lxml.etree.SubElement(elem, ns + "Coef", attrib=attribs).text = str(coef)
+        exponent_attrs = [f"exponent{d + 1}" for d in range(self.nvar)]
+        coef_tag = ns + "Coef"
+        for coord, coef in zip(np.ndindex(coefs.shape), coefs.flat, strict=True):
+            attribs = dict(zip(exponent_attrs, map(str, coord), strict=True))
+            lxml.etree.SubElement(elem, coef_tag, attrib=attribs).text = str(coef)
         self.parse_elem(elem)  # make sure result is parsable
 
 
@@ -244,6 +258,9 @@ class PolyType(PolyNdType):
         super().__init__(child_ns=child_ns)
 
 
+_POLY_TYPE = PolyType()
+
+
 class Poly2dType(PolyNdType):
     """Transcoder for two-dimensional polynomial (2D_POLY) XML parameter types."""
 
@@ -281,7 +298,7 @@ class XyzPolyType(Type):
             polynomials.
 
         """
-        xyz = [PolyType().parse_elem(elem.find(f"{{*}}{d}")) for d in "XYZ"]
+        xyz = [_POLY_TYPE.parse_elem(elem.find(f"{{*}}{d}")) for d in "XYZ"]
         xyz_coefs = np.zeros_like(xyz[0], shape=(max(len(d) for d in xyz), len(xyz)))
         for dim, coefs in enumerate(xyz):
             xyz_coefs[: len(coefs), dim] = coefs
@@ -308,7 +325,7 @@ class XyzPolyType(Type):
         ns = f"{{{elem_ns}}}" if elem_ns else ""
         for index, tag in enumerate("XYZ"):
             subelem = lxml.etree.SubElement(elem, ns + tag)
-            PolyType().set_elem(subelem, coefs[:, index])
+            _POLY_TYPE.set_elem(subelem, coefs[:, index])
         self.parse_elem(elem)  # make sure result is parsable
 
 
@@ -357,13 +374,16 @@ class SequenceType(abc.ABC, Type):
         """
         if self.subelements.keys() != val.keys():
             raise ValueError(f"{(val.keys())=} must match {self.subelements.keys()=}")
+        self._set_subelement_values(elem, [val[e_name] for e_name in self.subelements])
+        self.parse_subelements(elem)  # make sure result is parsable
+
+    def _set_subelement_values(self, elem: lxml.etree.Element, vals: Sequence) -> None:
+        """Replace ``elem``'s children with subelements set from ``vals`` in ``subelements`` order."""
         elem[:] = []
         elem_ns = self.child_ns if self.child_ns else lxml.etree.QName(elem).namespace
         ns = f"{{{elem_ns}}}" if elem_ns else ""
-        for e_name, e_type in self.subelements.items():
-            subelem = lxml.etree.SubElement(elem, ns + e_name)
-            e_type.set_elem(subelem, val[e_name])
-        self.parse_subelements(elem)  # make sure result is parsable
+        for (e_name, e_type), e_val in zip(self.subelements.items(), vals, strict=True):
+            e_type.set_elem(lxml.etree.SubElement(elem, ns + e_name), e_val)
 
 
 class ArrayType(SequenceType):
@@ -391,9 +411,7 @@ class ArrayType(SequenceType):
             raise ValueError(
                 f"{len(self.subelements)=} does not match expected {len(val)=}"
             )
-        super().set_subelements(
-            elem, dict((k, v) for k, v in zip(self.subelements, val, strict=True))
-        )
+        self._set_subelement_values(elem, val)
         self.parse_elem(elem)  # make sure result is parsable
 
 
@@ -517,11 +535,16 @@ class CmplxType(SequenceType):
 
     def parse_elem(self, elem: lxml.etree.Element) -> complex:
         """Returns the complex number encoded in ``elem``."""
-        return complex(*super().parse_subelements(elem).values())
+        return complex(
+            *(
+                e_type.parse_elem(elem.find(f"{{*}}{e_name}"))
+                for e_name, e_type in self.subelements.items()
+            )
+        )
 
     def set_elem(self, elem: lxml.etree.Element, val: complex) -> None:
         """Set ``elem`` node to the complex number ``val``."""
-        super().set_subelements(elem, {"Real": val.real, "Imag": val.imag})
+        self._set_subelement_values(elem, (val.real, val.imag))
         self.parse_elem(elem)  # make sure result is parsable
 
 
@@ -620,13 +643,13 @@ class ParameterType(Type):
     def parse_elem(self, elem) -> tuple[str, str]:
         """Returns a tuple containing (``elem["name"]``, ``elem.text``)."""
         name = elem.get("name")
-        val = TxtType().parse_elem(elem)
+        val = _TXT_TYPE.parse_elem(elem)
         return (name, val)
 
     def set_elem(self, elem, val: tuple[str, str]) -> None:
         """Set ``elem``'s name and value from a tuple of strings: (``name``, ``text``)"""
         elem.set("name", val[0])
-        TxtType().set_elem(elem, val[1])
+        _TXT_TYPE.set_elem(elem, val[1])
         self.parse_elem(elem)  # make sure result is parsable
 
 
@@ -649,9 +672,15 @@ class MtxType(Type):
         shape = tuple(int(elem.get(f"size{d}")) for d in (1, 2))
         if self.shape != shape:
             raise ValueError(f"elem {shape=} does not match expected {self.shape}")
+        indices = np.array(
+            [[int(entry.get("index1")), int(entry.get("index2"))] for entry in elem],
+            dtype=np.intp,
+        ).reshape(-1, 2)
+        values = np.fromiter(
+            (float(entry.text) for entry in elem), np.float64, count=indices.shape[0]
+        )
         val = np.zeros(shape)
-        for entry in elem:
-            val[*[int(entry.get(f"index{x}")) - 1 for x in (1, 2)]] = float(entry.text)
+        val[tuple(indices.T - 1)] = values
         return val
 
     def set_elem(self, elem: lxml.etree.Element, val: npt.ArrayLike) -> None:
@@ -673,7 +702,8 @@ class MtxType(Type):
         ns = f"{{{elem_ns}}}" if elem_ns else ""
         for d, nd in zip((1, 2), mtx.shape, strict=True):
             elem.set(f"size{d}", str(nd))
-        for indices, entry in np.ndenumerate(mtx):
-            attribs = {f"index{d + 1}": str(c + 1) for d, c in enumerate(indices)}
-            lxml.etree.SubElement(elem, ns + "Entry", attrib=attribs).text = str(entry)
+        entry_tag = ns + "Entry"
+        for (row, col), entry in zip(np.ndindex(mtx.shape), mtx.flat, strict=True):
+            attribs = {"index1": str(row + 1), "index2": str(col + 1)}
+            lxml.etree.SubElement(elem, entry_tag, attrib=attribs).text = str(entry)
         self.parse_elem(elem)  # make sure result is parsable
@@ -0,0 +1,46 @@
+import pathlib
+
+import lxml.etree
+import pytest
+
+import sarkit.sicd.projection as sicdproj
+
+DATAPATH = pathlib.Path(__file__).parents[3] / "data"
+
+
+# Session-scoped projection inputs are shared between tests and must not be modified.
+# Tests that need to alter them should use a copy.
+@pytest.fixture(scope="session")
+def session_proj_metadata_mono():
+    etree = lxml.etree.parse(DATAPATH / "example-sicd-1.3.0.xml")
+    proj_metadata = sicdproj.MetadataParams.from_xml(etree)
+    assert proj_metadata.is_monostatic()
+    return proj_metadata
+
+
+@pytest.fixture(scope="session")
+def session_proj_metadata_bi():
+    etree = lxml.etree.parse(DATAPATH / "example-sicd-1.4.0.xml")
+    proj_metadata = sicdproj.MetadataParams.from_xml(etree)
+    assert proj_metadata.is_bistatic()
+    return proj_metadata
+
+
+@pytest.fixture(scope="session")
+def session_sens_mat_mono(session_proj_metadata_mono):
+    return sicdproj.compute_sensitivity_matrices(session_proj_metadata_mono)
+
+
+@pytest.fixture(scope="session")
+def session_sens_mat_bi(session_proj_metadata_bi):
+    return sicdproj.compute_sensitivity_matrices(session_proj_metadata_bi)
+
+
+@pytest.fixture(scope="session")
+def session_proj_set_0_mono(session_proj_metadata_mono):
+    return sicdproj.compute_projection_sets(session_proj_metadata_mono, [0, 0])
+
+
+@pytest.fixture(scope="session")
+def session_proj_set_0_bi(session_proj_metadata_bi):
+    return sicdproj.compute_projection_sets(session_proj_metadata_bi, [0, 0])
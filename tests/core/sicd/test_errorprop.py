@@ -1,203 +1,190 @@
-import pathlib
-
-import lxml.etree
 import numpy as np
 import pytest
 
 import sarkit.sicd.projection as sicdproj
 
-DATAPATH = pathlib.Path(__file__).parents[3] / "data"
+
+def _read_only_eye(n):
+    eye = np.eye(n)
+    eye.setflags(write=False)
+    return eye
+
+
+# read-only so that any in-place modification by the code under test raises
+_EYE2, _EYE3, _EYE4, _EYE6, _EYE8, _EYE16 = map(_read_only_eye, (2, 3, 4, 6, 8, 16))
 
 
 def test_compute_ric_basis_vectors():
-    for uvec in sicdproj.compute_ric_basis_vectors([1, 2, 3], [4, 5, 6]):
-        assert uvec.shape == (3,)
-        assert np.linalg.norm(uvec) == pytest.approx(1.0)
+    uvecs = np.asarray(sicdproj.compute_ric_basis_vectors([1, 2, 3], [4, 5, 6]))
+    assert uvecs.shape == (3, 3)
+    np.testing.assert_allclose(np.einsum("ij,ij->i", uvecs, uvecs), 1.0)
 
 
 @pytest.mark.parametrize("frame", ("ECF", "RIC_ECF", "RIC_ECI"))
 def test_compute_ecef_pv_transformation(frame):
     t = sicdproj.compute_ecef_pv_transformation([1, 2, 3], [4, 5, 6], frame)
     if frame != "RIC_ECI":
-        assert t @ t.T == pytest.approx(np.eye(6))
-    assert t[:3, :3] @ t[:3, :3].T == pytest.approx(np.eye(3))
+        np.testing.assert_allclose(t @ t.T, _EYE6, atol=1e-12)
+    np.testing.assert_allclose(t[:3, :3] @ t[:3, :3].T, _EYE3, atol=1e-12)
 
 
-def test_compute_composite_error_no_apo_mono():
-    sicd_xmltree = lxml.etree.parse(DATAPATH / "example-sicd-1.3.0.xml")
-    projmeta = sicdproj.MetadataParams.from_xml(sicd_xmltree)
-    assert projmeta.is_monostatic()
-    proj_set_0 = sicdproj.compute_projection_sets(projmeta, [0, 0])
-    sens_mat = sicdproj.compute_sensitivity_matrices(projmeta)
-
+def test_compute_composite_error_no_apo_mono(
+    session_proj_metadata_mono, session_proj_set_0_mono, session_sens_mat_mono
+):
+    assert session_proj_metadata_mono.is_monostatic()
     # No error stats
     c_rgaz = sicdproj.compute_composite_error_no_apo_mono(
-        proj_set_0,
-        sens_mat,
+        session_proj_set_0_mono,
+        session_sens_mat_mono,
         sicdproj.ErrorStatParams(),
     )
     assert c_rgaz is None
 
     # No component
     c_rgaz = sicdproj.compute_composite_error_no_apo_mono(
-        proj_set_0,
-        sens_mat,
+        session_proj_set_0_mono,
+        session_sens_mat_mono,
         sicdproj.ErrorStatParams(
-            C_SCP_RGAZ=np.eye(2),
+            C_SCP_RGAZ=_EYE2,
         ),
     )
     assert c_rgaz is not None
 
     # Component
     c_rgaz = sicdproj.compute_composite_error_no_apo_mono(
-        proj_set_0,
-        sens_mat,
+        session_proj_set_0_mono,
+        session_sens_mat_mono,
         sicdproj.ErrorStatParams(
             component_mono=sicdproj.ComponentErrorStatMono(
-                C_AIF_APV=np.eye(6),
+                C_AIF_APV=_EYE6,
                 AIF="RIC_ECF",
                 VAR_RB=1.0,
                 VAR_CLK_SF=1.1,
                 VAR_TROP=1.2,
                 VAR_IONO=1.3,
             ),
-            C_UI=np.eye(2),
+            C_UI=_EYE2,
         ),
     )
     assert c_rgaz is not None
 
 
-def test_compute_composite_error_apo_mono():
-    sicd_xmltree = lxml.etree.parse(DATAPATH / "example-sicd-1.3.0.xml")
-    projmeta = sicdproj.MetadataParams.from_xml(sicd_xmltree)
-    assert projmeta.is_monostatic()
-    sens_mat = sicdproj.compute_sensitivity_matrices(projmeta)
-
+def test_compute_composite_error_apo_mono(
+    session_proj_metadata_mono, session_sens_mat_mono
+):
+    assert session_proj_metadata_mono.is_monostatic()
     # No error stats
     c_rgaz = sicdproj.compute_composite_error_apo_mono(
-        sens_mat,
+        session_sens_mat_mono,
         sicdproj.ApoErrorParams(),
     )
     assert c_rgaz is None
 
     # No component
     c_rgaz = sicdproj.compute_composite_error_apo_mono(
-        sens_mat,
+        session_sens_mat_mono,
         sicdproj.ApoErrorParams(
-            C_SCPAPO_RGAZ=np.eye(2),
+            C_SCPAPO_RGAZ=_EYE2,
         ),
     )
     assert c_rgaz is not None
 
     # Component
     c_rgaz = sicdproj.compute_composite_error_apo_mono(
-        sens_mat,
+        session_sens_mat_mono,
         sicdproj.ApoErrorParams(
-            C_SCPAPO_RGAZ=np.eye(2),
-            C_APOM=np.eye(8),
+            C_SCPAPO_RGAZ=_EYE2,
+            C_APOM=_EYE8,
         ),
     )
     assert c_rgaz is not None
 
 
-def test_compute_composite_error_no_apo_bi():
-    sicd_xmltree = lxml.etree.parse(DATAPATH / "example-sicd-1.4.0.xml")
-    projmeta = sicdproj.MetadataParams.from_xml(sicd_xmltree)
-    assert projmeta.is_bistatic()
-    proj_set_0 = sicdproj.compute_projection_sets(projmeta, [0, 0])
-    sens_mat = sicdproj.compute_sensitivity_matrices(projmeta)
-
+def test_compute_composite_error_no_apo_bi(
+    session_proj_metadata_bi, session_proj_set_0_bi, session_sens_mat_bi
+):
+    assert session_proj_metadata_bi.is_bistatic()
     # No error stats
     c_rgaz = sicdproj.compute_composite_error_no_apo_bi(
-        proj_set_0,
-        sens_mat,
+        session_proj_set_0_bi,
+        session_sens_mat_bi,
         sicdproj.ErrorStatParams(),
     )
     assert c_rgaz is None
 
     # No component
     c_rgaz = sicdproj.compute_composite_error_no_apo_bi(
-        proj_set_0,
-        sens_mat,
+        session_proj_set_0_bi,
+        session_sens_mat_bi,
         sicdproj.ErrorStatParams(
-            C_SCP_RRdot=np.eye(2),
+            C_SCP_RRdot=_EYE2,
         ),
     )
     assert c_rgaz is not None
 
     # Component
     c_rgaz = sicdproj.compute_composite_error_no_apo_bi(
-        proj_set_0,
-        sens_mat,
+        session_proj_set_0_bi,
+        session_sens_mat_bi,
         sicdproj.ErrorStatParams(
             component_bi=sicdproj.ComponentErrorStatBi(
-                C_XIF_XPV=np.eye(6),
+                C_XIF_XPV=_EYE6,
                 XIF="RIC_ECF",
-                C_RIF_RPV=np.eye(6),
+                C_RIF_RPV=_EYE6,
                 RIF="RIC_ECI",
-                CC_XIF_RIF_XPV_RPV=np.eye(6),
-                C_XRTF=np.eye(4),
-                C_ATM=np.eye(2),
+                CC_XIF_RIF_XPV_RPV=_EYE6,
+                C_XRTF=_EYE4,
+                C_ATM=_EYE2,
             ),
-            C_UI=np.eye(2),
+            C_UI=_EYE2,
         ),
     )
     assert c_rgaz is not None
 
 
-def test_compute_composite_error_apo_bi():
-    sicd_xmltree = lxml.etree.parse(DATAPATH / "example-sicd-1.4.0.xml")
-    projmeta = sicdproj.MetadataParams.from_xml(sicd_xmltree)
-    assert projmeta.is_bistatic()
-    sens_mat = sicdproj.compute_sensitivity_matrices(projmeta)
-
+def test_compute_composite_error_apo_bi(session_proj_metadata_bi, session_sens_mat_bi):
+    assert session_proj_metadata_bi.is_bistatic()
     # No error stats
     c_rgaz = sicdproj.compute_composite_error_apo_bi(
-        sens_mat,
+        session_sens_mat_bi,
         sicdproj.ApoErrorParams(),
     )
     assert c_rgaz is None
 
     # No component
     c_rgaz = sicdproj.compute_composite_error_apo_bi(
-        sens_mat,
+        session_sens_mat_bi,
         sicdproj.ApoErrorParams(
-            C_SCPAPO_RRdot=np.eye(2),
+            C_SCPAPO_RRdot=_EYE2,
         ),
     )
     assert c_rgaz is not None
 
     # Component
     c_rgaz = sicdproj.compute_composite_error_apo_bi(
-        sens_mat,
+        session_sens_mat_bi,
         sicdproj.ApoErrorParams(
-            C_APOXR=np.eye(16),
+            C_APOXR=_EYE16,
         ),
     )
     assert c_rgaz is not None
 
 
 @pytest.mark.parametrize(
-    "xmlpath",
-    ((DATAPATH / "example-sicd-1.3.0.xml"), (DATAPATH / "example-sicd-1.4.0.xml")),
+    "sens_mat_name", ("session_sens_mat_mono", "session_sens_mat_bi")
 )
-def test_compute_i2s_error(xmlpath):
-    sicd_xmltree = lxml.etree.parse(xmlpath)
-    projmeta = sicdproj.MetadataParams.from_xml(sicd_xmltree)
-    sens_mat = sicdproj.compute_sensitivity_matrices(projmeta)
+def test_compute_i2s_error(sens_mat_name, request):
+    sens_mat = request.getfixturevalue(sens_mat_name)
 
-    c_pt = sicdproj.compute_i2s_error([[1, 0], [0, 1]], np.eye(2), 0.24, sens_mat)
+    c_pt = sicdproj.compute_i2s_error([[1, 0], [0, 1]], _EYE2, 0.24, sens_mat)
     assert c_pt.shape == (3, 3)
 
 
 @pytest.mark.parametrize(
-    "xmlpath",
-    ((DATAPATH / "example-sicd-1.3.0.xml"), (DATAPATH / "example-sicd-1.4.0.xml")),
+    "sens_mat_name", ("session_sens_mat_mono", "session_sens_mat_bi")
 )
-def test_compute_s2i_error(xmlpath):
-    sicd_xmltree = lxml.etree.parse(xmlpath)
-    projmeta = sicdproj.MetadataParams.from_xml(sicd_xmltree)
-    sens_mat = sicdproj.compute_sensitivity_matrices(projmeta)
+def test_compute_s2i_error(sens_mat_name, request):
+    sens_mat = request.getfixturevalue(sens_mat_name)
 
-    c_il = sicdproj.compute_s2i_error([[1, 0], [0, 1]], np.eye(3), sens_mat)
+    c_il = sicdproj.compute_s2i_error([[1, 0], [0, 1]], _EYE3, sens_mat)
     assert c_il.shape == (2, 2)
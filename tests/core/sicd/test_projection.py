@@ -18,30 +18,35 @@ DATAPATH = pathlib.Path(__file__).parents[3] / "data"
 
 
 @pytest.fixture
-def example_proj_metadata():
-    etree = lxml.etree.parse(DATAPATH / "example-sicd-1.3.0.xml")
-    return sicdproj.MetadataParams.from_xml(etree)
+def example_proj_metadata(session_proj_metadata_mono):
+    return copy.deepcopy(session_proj_metadata_mono)
 
 
 @pytest.fixture
-def example_proj_metadata_bi():
-    etree = lxml.etree.parse(DATAPATH / "example-sicd-1.4.0.xml")
-    proj_metadata = sicdproj.MetadataParams.from_xml(etree)
-    assert not proj_metadata.is_monostatic()
-    return proj_metadata
+def example_proj_metadata_bi(session_proj_metadata_bi):
+    return copy.deepcopy(session_proj_metadata_bi)
 
 
-@pytest.fixture(
-    params=[DATAPATH / "example-sicd-1.3.0.xml", DATAPATH / "example-sicd-1.4.0.xml"]
-)
+@pytest.fixture(params=["session_proj_metadata_mono", "session_proj_metadata_bi"])
 def mono_and_bi_proj_metadata(request):
-    etree = lxml.etree.parse(request.param)
-    return sicdproj.MetadataParams.from_xml(etree)
+    return copy.deepcopy(request.getfixturevalue(request.param))
+
 
+def _read_only(arr):
+    arr.setflags(write=False)
+    return arr
 
-@pytest.fixture(params=[(3, 4, 5, 2), (2,), (1, 2), (2, 2)])
+
+@pytest.fixture(scope="module", params=[(3, 4, 5, 2), (2,), (1, 2), (2, 2)])
 def image_grid_locations(request):
-    return np.random.default_rng(12345).uniform(size=request.param)
+    return _read_only(np.random.default_rng(12345).uniform(size=request.param))
+
+
+@pytest.fixture(scope="module")
+def wide_image_grid_locations():
+    return _read_only(
+        np.random.default_rng(12345).uniform(low=-24.0, high=24.0, size=(3, 4, 5, 2))
+    )
 
 
 def test_metadata_params():
@@ -103,10 +108,10 @@ def test_apoerrorparams(xmlfile):
             assert np.all(np.linalg.eigvalsh(val) >= 0.0)
 
 
-def test_image_plane_parameters_roundtrip(example_proj_metadata):
-    image_grid_locations = np.random.default_rng(12345).uniform(
-        low=-24, high=24, size=(3, 4, 5, 2)
-    )
+def test_image_plane_parameters_roundtrip(
+    example_proj_metadata, wide_image_grid_locations
+):
+    image_grid_locations = wide_image_grid_locations
     image_plane_points = sicdproj.image_grid_to_image_plane_point(
         example_proj_metadata.SCP,
         example_proj_metadata.uRow,
@@ -160,6 +165,17 @@ def test_compute_coa_pos_vel_bi(example_proj_metadata_bi):
     )
 
 
+def test_compute_coa_pos_vel_bi_batched(example_proj_metadata_bi):
+    t_coa = example_proj_metadata_bi.t_SCP_COA + np.linspace(-1, 1, 5)
+    batched = sicdproj.compute_coa_pos_vel(example_proj_metadata_bi, t_coa)
+    for idx, t in enumerate(t_coa):
+        single = sicdproj.compute_coa_pos_vel(example_proj_metadata_bi, t)
+        for field in dataclasses.fields(single):
+            assert np.allclose(
+                getattr(batched, field.name)[idx], getattr(single, field.name)
+            )
+
+
 def test_scp_projection_set_mono(example_proj_metadata):
     assert example_proj_metadata.is_monostatic()
     r_scp_coa, rdot_scp_coa = sicdproj.compute_scp_coa_r_rdot(example_proj_metadata)
@@ -194,7 +210,7 @@ def test_scp_coa_slant_plane_normal(pm_fixture_name, request):
     u_spn_scp_coa = sicdproj.compute_scp_coa_slant_plane_normal(proj_metadata)
 
     # unit vector
-    assert np.linalg.norm(u_spn_scp_coa) == pytest.approx(1.0)
+    assert u_spn_scp_coa @ u_spn_scp_coa == pytest.approx(1.0)
 
     # points away from earth
     assert np.linalg.norm(proj_metadata.SCP) < np.linalg.norm(
@@ -222,11 +238,10 @@ def test_compute_pt_r_rdot_parameters_mono(example_proj_metadata):
     assert pt_r_rdot_params.Rdot_Avg_PT == pytest.approx(rdot_scp)
 
 
-def test_r_rdot_to_ground_plane(example_proj_metadata):
-    im_coords = np.random.default_rng(12345).uniform(
-        low=-24.0, high=24.0, size=(3, 4, 5, 2)
+def test_r_rdot_to_ground_plane(example_proj_metadata, wide_image_grid_locations):
+    proj_sets_mono = sicdproj.compute_projection_sets(
+        example_proj_metadata, wide_image_grid_locations
     )
-    proj_sets_mono = sicdproj.compute_projection_sets(example_proj_metadata, im_coords)
     scp_spn = sicdproj.compute_scp_coa_slant_plane_normal(example_proj_metadata)
     gpp_tgt_mono = sicdproj.r_rdot_to_ground_plane_mono(
         example_proj_metadata.LOOK,
@@ -262,13 +277,16 @@ def test_r_rdot_to_ground_plane(example_proj_metadata):
 @pytest.mark.parametrize(
     "mdata_name", ("example_proj_metadata", "example_proj_metadata_bi")
 )
-def test_r_rdot_to_hae_surface(mdata_name, scalar_hae, request):
+def test_r_rdot_to_hae_surface(
+    mdata_name, scalar_hae, request, wide_image_grid_locations
+):
     proj_metadata = request.getfixturevalue(mdata_name)
-    rng = np.random.default_rng(12345)
-    im_coords = rng.uniform(low=-24.0, high=24.0, size=(3, 4, 5, 2))
+    im_coords = wide_image_grid_locations
     hae0 = proj_metadata.SCP_HAE
     if not scalar_hae:
-        hae0 += rng.uniform(low=-24.0, high=24.0, size=im_coords.shape[:-1])
+        hae0 += np.random.default_rng(54321).uniform(
+            low=-24.0, high=24.0, size=im_coords.shape[:-1]
+        )
     proj_sets = sicdproj.compute_projection_sets(proj_metadata, im_coords)
     spp_tgt, _, success = sicdproj.r_rdot_to_constant_hae_surface(
         proj_metadata.LOOK,
@@ -463,39 +481,37 @@ def _projection_sets_smoketest(mdata, gridlocs):
     assert spp_tgt.shape == gridlocs.shape[:-1] + (3,)
 
 
-def test_r_rdot_from_rgazim_rgazcomp(example_proj_metadata, image_grid_locations):
-    example_proj_metadata.IFA = "RGAZCOMP"
-    example_proj_metadata.Grid_Type = "RGAZIM"
-    example_proj_metadata.AzSF = 2.0
-    _projection_sets_smoketest(example_proj_metadata, image_grid_locations)
-
-
-def test_r_rdot_from_rgzero(example_proj_metadata, image_grid_locations):
-    example_proj_metadata.IFA = "RMA"
-    example_proj_metadata.Grid_Type = "RGZERO"
-    example_proj_metadata.cT_CA = np.array([1.0, 0.0001])
-    example_proj_metadata.cDRSF = np.array([[1.0, 0.0001], [1.0, 0.0001]])
-    example_proj_metadata.R_CA_SCP = 10000
-    _projection_sets_smoketest(example_proj_metadata, image_grid_locations)
+_RMA_OVERRIDES = {
+    "IFA": "RMA",
+    "cT_CA": np.array([1.0, 0.0001]),
+    "cDRSF": np.array([[1.0, 0.0001], [1.0, 0.0001]]),
+    "R_CA_SCP": 10000,
+}
 
 
-def test_r_rdot_from_xrgycr(mono_and_bi_proj_metadata, image_grid_locations):
-    mono_and_bi_proj_metadata.Grid_Type = "XRGYCR"
-    _projection_sets_smoketest(mono_and_bi_proj_metadata, image_grid_locations)
-
-
-def test_r_rdot_from_xctyat(mono_and_bi_proj_metadata, image_grid_locations):
-    mono_and_bi_proj_metadata.Grid_Type = "XCTYAT"
-    _projection_sets_smoketest(mono_and_bi_proj_metadata, image_grid_locations)
-
-
-def test_r_rdot_from_plane(mono_and_bi_proj_metadata, image_grid_locations):
-    mono_and_bi_proj_metadata.IFA = "RMA"
-    mono_and_bi_proj_metadata.Grid_Type = "PLANE"
-    mono_and_bi_proj_metadata.cT_CA = np.array([1.0, 0.0001])
-    mono_and_bi_proj_metadata.cDRSF = np.array([[1.0, 0.0001], [1.0, 0.0001]])
-    mono_and_bi_proj_metadata.R_CA_SCP = 10000
-    _projection_sets_smoketest(mono_and_bi_proj_metadata, image_grid_locations)
+@pytest.mark.parametrize(
+    "mdata_name, overrides",
+    [
+        (
+            "session_proj_metadata_mono",
+            {"IFA": "RGAZCOMP", "Grid_Type": "RGAZIM", "AzSF": 2.0},
+        ),
+        ("session_proj_metadata_mono", {"Grid_Type": "RGZERO", **_RMA_OVERRIDES}),
+    ]
+    + [
+        (mdata_name, overrides)
+        for mdata_name in ("session_proj_metadata_mono", "session_proj_metadata_bi")
+        for overrides in (
+            {"Grid_Type": "XRGYCR"},
+            {"Grid_Type": "XCTYAT"},
+            {"Grid_Type": "PLANE", **_RMA_OVERRIDES},
+        )
+    ],
+    ids=lambda x: x.get("Grid_Type") if isinstance(x, dict) else x.split("_")[-1],
+)
+def test_r_rdot_from_grid(mdata_name, overrides, image_grid_locations, request):
+    mdata = dataclasses.replace(request.getfixturevalue(mdata_name), **overrides)
+    _projection_sets_smoketest(mdata, image_grid_locations)
 
 
 def test_apos_from_xml():
@@ -513,8 +529,8 @@ def test_apos_from_xml():
     assert not unset_attrs
 
 
-def test_apo_mono(example_proj_metadata):
-    meta = example_proj_metadata
+def test_apo_mono(session_proj_metadata_mono):
+    meta = session_proj_metadata_mono
     assert meta.is_monostatic()
     apos = sicdproj.AdjustableParameterOffsets(
         delta_ARP_SCP_COA=np.array([10000.0, 11000.0, 12000.0]),
@@ -533,8 +549,8 @@ def test_apo_mono(example_proj_metadata):
     assert adjust_proj_set.Rdot_COA == proj_set.Rdot_COA
 
 
-def test_apo_bi(example_proj_metadata_bi):
-    meta = example_proj_metadata_bi
+def test_apo_bi(session_proj_metadata_bi):
+    meta = session_proj_metadata_bi
     assert meta.is_bistatic()
     apos = sicdproj.AdjustableParameterOffsets(
         delta_Xmt_SCP_COA=np.array([10000.0, 11000.0, 12000.0]),
@@ -561,6 +577,104 @@ def test_apo_bi(example_proj_metadata_bi):
     assert adjust_proj_set.Rdot_Avg_COA != proj_set.Rdot_Avg_COA
 
 
+@pytest.mark.parametrize(
+    "grid_type, ifa",
+    [("RGAZIM", "PFA"), ("XRGYCR", None), ("XCTYAT", None), ("PLANE", None)],
+)
+def test_projection_sets_jac(mono_and_bi_proj_metadata, grid_type, ifa):
+    mono_and_bi_proj_metadata.Grid_Type = grid_type
+    mono_and_bi_proj_metadata.IFA = ifa or mono_and_bi_proj_metadata.IFA
+    _check_projection_sets_jac(mono_and_bi_proj_metadata)
+
+
+def test_projection_sets_jac_rgazcomp(example_proj_metadata):
+    example_proj_metadata.IFA = "RGAZCOMP"
+    example_proj_metadata.AzSF = 2e-5
+    _check_projection_sets_jac(example_proj_metadata)
+
+
+def test_projection_sets_jac_rgzero(example_proj_metadata):
+    example_proj_metadata.IFA = "RMA"
+    example_proj_metadata.Grid_Type = "RGZERO"
+    example_proj_metadata.cT_CA = np.array([example_proj_metadata.cT_COA[0, 0], 1e-4])
+    example_proj_metadata.cDRSF = np.array([[1.0, 1e-4], [1e-4, 1e-5]])
+    example_proj_metadata.R_CA_SCP = 10000
+    _check_projection_sets_jac(example_proj_metadata)
+
+
+def _check_projection_sets_jac(mdata):
+    gridlocs = np.random.default_rng(12345).uniform(-500, 500, size=(2, 3, 2))
+    proj_set = sicdproj.compute_projection_sets(mdata, gridlocs)
+    jac = sicdproj._calc._projection_sets_jac(mdata, gridlocs, proj_set)
+    step = 1e-3
+    for index, increment in enumerate(np.eye(2) * step):
+        proj_set_plus = sicdproj.compute_projection_sets(mdata, gridlocs + increment)
+        proj_set_minus = sicdproj.compute_projection_sets(mdata, gridlocs - increment)
+        for field in dataclasses.fields(proj_set):
+            central_diff = (
+                getattr(proj_set_plus, field.name) - getattr(proj_set_minus, field.name)
+            ) / (2 * step)
+            deriv = getattr(jac, field.name).take(index, axis=gridlocs.ndim - 1)
+            assert deriv.shape == central_diff.shape
+            # allow for round-off in the differenced values
+            roundoff = 1e-14 * np.abs(getattr(proj_set, field.name)).max() / step
+            assert np.allclose(deriv, central_diff, rtol=1e-5, atol=roundoff)
+
+
+@pytest.mark.parametrize(
+    "mdata_name", ("session_proj_metadata_mono", "session_proj_metadata_bi")
+)
+def test_sensitivity_matrices_analytic(mdata_name, request):
+    proj_metadata = request.getfixturevalue(mdata_name)
+    analytic = sicdproj.compute_image_location_sensitivity_matrices(
+        proj_metadata, analytic=True
+    )
+    finite_diff = sicdproj.compute_image_location_sensitivity_matrices(
+        proj_metadata, delta_xrow=1e-2, delta_ycol=1e-2
+    )
+    assert np.allclose(
+        analytic.M_RRdot_IL,
+        finite_diff.M_RRdot_IL,
+        rtol=0,
+        atol=1e-4 * np.abs(analytic.M_RRdot_IL).max(),
+    )
+
+
+def test_proj_geom_params_p_pdot(mono_and_bi_proj_metadata):
+    pt0 = mono_and_bi_proj_metadata.SCP
+    _, _, geom_params = sicdproj._sensitivity._compute_point_geometry(
+        mono_and_bi_proj_metadata, pt0
+    )
+    if mono_and_bi_proj_metadata.is_monostatic():
+        assert geom_params.p is geom_params.uPT
+        assert geom_params.pdot is geom_params.uPTDot
+    else:
+        assert geom_params.p is geom_params.bP
+        assert geom_params.pdot is geom_params.bPDot
+
+
+def test_proj_geom_params_bi_scalars(session_proj_metadata_bi):
+    proj_metadata = session_proj_metadata_bi
+    scalar_names = (
+        "R_Xmt_0coa",
+        "Rdot_Xmt_0coa",
+        "R_Rcv_0coa",
+        "Rdot_Rcv_0coa",
+        "TRTX_0",
+        "TRTXdot_0",
+    )
+    _, _, single = sicdproj._sensitivity._compute_point_geometry(
+        proj_metadata, proj_metadata.SCP
+    )
+    for name in scalar_names:
+        assert isinstance(getattr(single, name), float)
+
+    pt0 = proj_metadata.SCP + np.zeros((2, 3, 3))
+    _, _, batched = sicdproj._sensitivity._compute_point_geometry(proj_metadata, pt0)
+    for name in scalar_names:
+        assert getattr(batched, name).shape == (2, 3)
+
+
 def test_sensitivity_matrices(example_proj_metadata):
     mats = sicdproj.compute_sensitivity_matrices(example_proj_metadata)
 
@@ -573,6 +687,44 @@ def test_sensitivity_matrices(example_proj_metadata):
     assert np.allclose(mats.M_SPXY_PT @ mats.M_PT_GPXY, mats.M_SPXY_GPXY)
 
 
+@pytest.mark.parametrize(
+    "mdata_name", ("session_proj_metadata_mono", "session_proj_metadata_bi")
+)
+def test_sensitivity_matrices_batched(mdata_name, request):
+    proj_metadata = request.getfixturevalue(mdata_name)
+    pt0 = proj_metadata.SCP + np.random.default_rng(12345).uniform(
+        -1000, 1000, size=(2, 3, 3)
+    )
+    batched = sicdproj.compute_sensitivity_matrices(proj_metadata, pt0)
+    for idx in np.ndindex(pt0.shape[:-1]):
+        single = sicdproj.compute_sensitivity_matrices(proj_metadata, pt0[idx])
+        for field in dataclasses.fields(single):
+            single_mat = getattr(single, field.name)
+            batched_mat = getattr(batched, field.name)
+            assert batched_mat.shape == pt0.shape[:-1] + single_mat.shape
+            assert np.allclose(batched_mat[idx], single_mat, rtol=1e-10, atol=0)
+
+
+@pytest.mark.parametrize(
+    "mdata_name", ("session_proj_metadata_mono", "session_proj_metadata_bi")
+)
+@pytest.mark.skipif(not __debug__, reason="asserts stripped under -O")
+def test_sensitivity_matrices_validate_shapes(mdata_name, request, monkeypatch):
+    monkeypatch.setattr(sicdproj._sensitivity, "_VALIDATE_SHAPES", True)
+    proj_metadata = request.getfixturevalue(mdata_name)
+    mats = sicdproj.compute_sensitivity_matrices(proj_metadata)
+    assert mats.M_SPXY_PT.shape == (2, 3)
+    with pytest.raises(AssertionError):
+        sicdproj.SlantPlaneSensitivityMatrices(
+            **{
+                **dataclasses.asdict(
+                    sicdproj.compute_slant_plane_sensitivity_matrices(proj_metadata)
+                ),
+                "M_SPXY_PT": np.zeros((3, 2)),
+            }
+        )
+
+
 @pytest.mark.parametrize(
     "xmlpath",
     [DATAPATH / "example-sicd-1.3.0.xml", DATAPATH / "example-sicd-1.4.0.xml"],
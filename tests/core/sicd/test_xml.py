@@ -44,7 +44,7 @@ def test_transcoders():
     for xml_file in (DATAPATH / "syntax_only/sicd").glob("*.xml"):
         etree = lxml.etree.parse(xml_file)
         basis_version = lxml.etree.QName(etree.getroot()).namespace
-        schema = lxml.etree.XMLSchema(file=sksicd.VERSION_INFO[basis_version]["schema"])
+        schema = testing.get_schema(sksicd.VERSION_INFO[basis_version]["schema"])
         schema.assertValid(etree)
         xml_helper = sksicd.XmlHelper(etree)
         for elem in reversed(list(xml_helper.element_tree.iter())):
@@ -10,32 +10,40 @@ from tests.core import testing
 
 DATAPATH = pathlib.Path(__file__).parents[3] / "data"
 
+_RNG = np.random.default_rng(0xDEADBEEF)
+
 
 def test_anglemagnitude():
-    data = np.random.default_rng().random((2,))
+    data = _RNG.random((2,))
     elem = lxml.etree.Element("{faux-ns}AngleMagnitude")
     type_obj = sksidd.AngleMagnitudeType()
     type_obj.set_elem(elem, data)
-    assert np.array_equal(type_obj.parse_elem(elem), data)
+    npt.assert_array_equal(type_obj.parse_elem(elem), data)
 
 
 def test_filtercoefficient():
-    data = np.random.default_rng().random((4, 7))
+    data = _RNG.random((4, 7))
     elem = lxml.etree.Element("{faux-ns}FilterCoefficients")
     type_obj = sksidd.FilterCoefficientType("rowcol")
     type_obj.set_elem(elem, data)
-    assert np.array_equal(type_obj.parse_elem(elem), data)
+    npt.assert_array_equal(type_obj.parse_elem(elem), data)
     type_obj = sksidd.FilterCoefficientType("phasingpoint")
     type_obj.set_elem(elem, data)
-    assert np.array_equal(type_obj.parse_elem(elem), data)
+    npt.assert_array_equal(type_obj.parse_elem(elem), data)
 
 
 def test_intlist():
-    data = np.random.default_rng().integers(256, size=11)
+    data = _RNG.integers(256, size=11)
     elem = lxml.etree.Element("{faux-ns}IntList")
     type_obj = sksidd.IntListType()
     type_obj.set_elem(elem, data)
-    assert np.array_equal(type_obj.parse_elem(elem), data)
+    npt.assert_array_equal(type_obj.parse_elem(elem), data)
+    elem.text = "\n  1 2\t3  4\n"
+    npt.assert_array_equal(type_obj.parse_elem(elem), [1, 2, 3, 4])
+    for text in (None, "", " \n\t"):
+        elem.text = text
+        with pytest.raises(ValueError, match="must not be empty"):
+            type_obj.parse_elem(elem)
 
 
 def test_image_corners_type():
@@ -50,38 +58,45 @@ def test_image_corners_type():
     elem = lxml.etree.Element("{faux-ns}ImageCorners")
     type_obj = sksidd.ImageCornersType()
     type_obj.set_elem(elem, data)
-    assert np.array_equal(type_obj.parse_elem(elem), data)
+    npt.assert_array_equal(type_obj.parse_elem(elem), data)
+
+    elem[2].set("index", "3:LRFC")
+    with pytest.raises(ValueError, match="missing ICP index '3:LRLC'"):
+        type_obj.parse_elem(elem)
+    del elem[2]
+    with pytest.raises(ValueError, match="missing ICP index '3:LRLC'"):
+        type_obj.parse_elem(elem)
 
 
 def test_rangeazimuth():
-    data = np.random.default_rng().random((2,))
+    data = _RNG.random((2,))
     elem = lxml.etree.Element("{faux-ns}RangeAzimuth")
     type_obj = sksidd.RangeAzimuthType()
     type_obj.set_elem(elem, data)
-    assert np.array_equal(type_obj.parse_elem(elem), data)
+    npt.assert_array_equal(type_obj.parse_elem(elem), data)
 
 
 def test_rowcoldble():
-    data = np.random.default_rng().random((2,))
+    data = _RNG.random((2,))
     elem = lxml.etree.Element("{faux-ns}RowColDbl")
     type_obj = sksidd.RowColDblType()
     type_obj.set_elem(elem, data)
-    assert np.array_equal(type_obj.parse_elem(elem), data)
+    npt.assert_array_equal(type_obj.parse_elem(elem), data)
 
 
 def test_sfapointtype():
     data = [1.1, 1.2, 1.3]
     elem = sksidd.SfaPointType().make_elem("{ns}SfaPoint", data)
-    assert np.array_equal(sksidd.SfaPointType().parse_elem(elem), data)
+    npt.assert_array_equal(sksidd.SfaPointType().parse_elem(elem), data)
     sksidd.SfaPointType().set_elem(elem, data[:-1])
-    assert np.array_equal(sksidd.SfaPointType().parse_elem(elem), data[:-1])
+    npt.assert_array_equal(sksidd.SfaPointType().parse_elem(elem), data[:-1])
 
 
 def test_lookup_table_type():
     data = [1, 2, 3]
     t = sksidd.LookupTableType()
     elem = t.make_elem("{ns}LookupTable", data)
-    assert np.array_equal(t.parse_elem(elem), data)
+    npt.assert_array_equal(t.parse_elem(elem), data)
     assert int(elem.get("size")) == 3
 
 
@@ -89,27 +104,32 @@ def test_lookup3_table_type():
     data = [[1, 2, 3], [4, 5, 6]]
     t = sksidd.Lookup3TableType()
     elem = t.make_elem("{ns}Lookup3Table", data)
-    assert np.array_equal(t.parse_elem(elem), data)
+    npt.assert_array_equal(t.parse_elem(elem), data)
     assert int(elem.get("size")) == 2
+    elem.text = "  "
+    with pytest.raises(ValueError, match="must not be empty"):
+        t.parse_elem(elem)
 
 
-def test_transcoders():
+@pytest.mark.parametrize(
+    "xml_file", sorted((DATAPATH / "syntax_only/sidd").rglob("*.xml"))
+)
+def test_transcoders(xml_file):
     no_transcode_leaf = set()
-    for xml_file in (DATAPATH / "syntax_only/sidd").rglob("*.xml"):
-        etree = lxml.etree.parse(xml_file)
-        basis_version = lxml.etree.QName(etree.getroot()).namespace
-        schema = lxml.etree.XMLSchema(file=sksidd.VERSION_INFO[basis_version]["schema"])
-        schema.assertValid(etree)
-        xml_helper = sksidd.XmlHelper(etree)
-        for elem in reversed(list(xml_helper.element_tree.iter())):
-            try:
-                val = xml_helper.load_elem(elem)
-                xml_helper.set_elem(elem, val)
-                schema.assertValid(xml_helper.element_tree)
-                np.testing.assert_equal(xml_helper.load_elem(elem), val)
-            except LookupError:
-                if len(elem) == 0:
-                    no_transcode_leaf.add(xml_helper.element_tree.getelementpath(elem))
+    etree = lxml.etree.parse(xml_file)
+    basis_version = lxml.etree.QName(etree.getroot()).namespace
+    schema = testing.get_schema(sksidd.VERSION_INFO[basis_version]["schema"])
+    schema.assertValid(etree)
+    xml_helper = sksidd.XmlHelper(etree)
+    for elem in reversed(list(xml_helper.element_tree.iter())):
+        try:
+            val = xml_helper.load_elem(elem)
+            xml_helper.set_elem(elem, val)
+            schema.assertValid(xml_helper.element_tree)
+            np.testing.assert_equal(xml_helper.load_elem(elem), val)
+        except LookupError:
+            if len(elem) == 0:
+                no_transcode_leaf.add(xml_helper.element_tree.getelementpath(elem))
 
     todos = {xmlpath for xmlpath in no_transcode_leaf if "Classification" in xmlpath}
     assert not (no_transcode_leaf - todos)
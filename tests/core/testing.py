@@ -1,6 +1,15 @@
+import functools
+
+import lxml.etree
 import numpy.testing as npt
 
 
+@functools.cache
+def get_schema(schema_file) -> lxml.etree.XMLSchema:
+    """Return the compiled XML schema for ``schema_file``, reusing it across tests"""
+    return lxml.etree.XMLSchema(file=schema_file)
+
+
 def elem_cmp(a, b, xsdhelper):
     if a.tag != b.tag:
         return False
@@ -6,11 +6,15 @@ import sarkit.sidd as sksidd
 import sarkit.xmlhelp as skxml
 
 
-def test_elementwrapper():
+@pytest.fixture(scope="module")
+def sidd_xsdhelper():
+    return sksidd.XsdHelper("urn:SIDD:3.0.0")
+
+
+def test_elementwrapper(sidd_xsdhelper):
     root_ns = "urn:SIDD:3.0.0"
     siddroot = lxml.etree.Element(f"{{{root_ns}}}SIDD")
-    xmlhelp = sksidd.XsdHelper(root_ns)
-    wrapped_siddroot = skxml.ElementWrapper(siddroot, xsdhelper=xmlhelp)
+    wrapped_siddroot = skxml.ElementWrapper(siddroot, xsdhelper=sidd_xsdhelper)
 
     assert len(wrapped_siddroot) == 0
     assert not wrapped_siddroot
@@ -175,17 +179,17 @@ def test_elementwrapper():
     )
 
 
-def test_elementwrapper_tofromdict():
+def test_elementwrapper_tofromdict(sidd_xsdhelper):
     root_ns = "urn:SIDD:3.0.0"
     siddroot = lxml.etree.parse(
         "data/syntax_only/sidd/0000-syntax-only-sidd-3.0.xml"
     ).getroot()
-    xmlhelp = sksidd.XsdHelper(root_ns)
-    wrapped_siddroot = skxml.ElementWrapper(siddroot, xsdhelper=xmlhelp)
+    wrapped_siddroot = skxml.ElementWrapper(siddroot, xsdhelper=sidd_xsdhelper)
 
     dict1 = wrapped_siddroot.to_dict()
     wrapped_root_fromdict = skxml.ElementWrapper(
-        lxml.etree.Element(lxml.etree.QName(root_ns, "SIDD")), xsdhelper=xmlhelp
+        lxml.etree.Element(lxml.etree.QName(root_ns, "SIDD")),
+        xsdhelper=sidd_xsdhelper,
     )
     wrapped_root_fromdict.from_dict(dict1)
     dict2 = wrapped_root_fromdict.to_dict()
@@ -201,11 +205,37 @@ def test_elementwrapper_tofromdict():
     assert orig_elempaths.issubset(fromdict_elempaths)
 
 
-def test_elementwrapper_setdefault():
+def test_elementwrapper_fromdict_schema_order(sidd_xsdhelper):
+    root_ns = "urn:SIDD:3.0.0"
+    siddroot = lxml.etree.parse(
+        "data/syntax_only/sidd/0000-syntax-only-sidd-3.0.xml"
+    ).getroot()
+    dict1 = skxml.ElementWrapper(siddroot, xsdhelper=sidd_xsdhelper).to_dict()
+
+    def reverse_keys(val):
+        if isinstance(val, dict):
+            return {k: reverse_keys(val[k]) for k in reversed(val)}
+        if isinstance(val, tuple):
+            return tuple(map(reverse_keys, val))
+        return val
+
+    roots = []
+    for val in (dict1, reverse_keys(dict1)):
+        wrapped = skxml.ElementWrapper(
+            lxml.etree.Element(lxml.etree.QName(root_ns, "SIDD")),
+            xsdhelper=sidd_xsdhelper,
+        )
+        wrapped.from_dict(val)
+        roots.append(wrapped.elem)
+    assert lxml.etree.tostring(roots[0], method="c14n") == lxml.etree.tostring(
+        roots[1], method="c14n"
+    )
+
+
+def test_elementwrapper_setdefault(sidd_xsdhelper):
     root_ns = "urn:SIDD:3.0.0"
     siddroot = lxml.etree.Element(f"{{{root_ns}}}SIDD")
-    xmlhelp = sksidd.XsdHelper(root_ns)
-    wrapped_siddroot = skxml.ElementWrapper(siddroot, xsdhelper=xmlhelp)
+    wrapped_siddroot = skxml.ElementWrapper(siddroot, xsdhelper=sidd_xsdhelper)
 
     assert wrapped_siddroot["ProductCreation"].setdefault("ProductName", "foo") == "foo"
     assert wrapped_siddroot["ProductCreation"]["ProductName"] == "foo"
@@ -215,3 +245,73 @@ def test_elementwrapper_setdefault():
     assert wrapped_siddroot["Display"].setdefault("NumBands", 24) == 24
     with pytest.raises(KeyError):
         wrapped_siddroot["ProductCreation"].setdefault("NotARealFieldName")
+
+
+def test_xsdhelper_get_transcoder_cached():
+    xsdhelper = sksidd.XsdHelper("urn:SIDD:3.0.0")
+    typename = "{urn:SICommon:1.0}XYZType"
+    transcoder = xsdhelper._cached_transcoder(typename)
+    assert xsdhelper._cached_transcoder(typename) is transcoder
+    assert list(xsdhelper._transcoder_cache) == [(typename, None)]
+
+
+def test_xsdhelper_xsdtypes_shared():
+    assert (
+        sksidd.XsdHelper("urn:SIDD:3.0.0").xsdtypes
+        is sksidd.XsdHelper("urn:SIDD:3.0.0").xsdtypes
+    )
+    assert (
+        sksidd.XsdHelper("urn:SIDD:3.0.0").xsdtypes
+        is not sksidd.XsdHelper("urn:SIDD:2.0.0").xsdtypes
+    )
+
+
+def test_localname_cached():
+    tag = "{urn:SIDD:3.0.0}ProductCreation"
+    assert skxml._core._localname(tag) == "ProductCreation"
+    assert skxml._core._localname("ProductCreation") == "ProductCreation"
+    hits = skxml._core._localname.cache_info().hits
+    assert skxml._core._localname(tag) == "ProductCreation"
+    assert skxml._core._localname.cache_info().hits == hits + 1
+
+
+class _AttribOnlyXsdHelper(skxml.XsdHelper):
+    def _read_xsdtypes_json(self, root_ns):
+        return skxml.dumps_xsdtypes(
+            {
+                "/": {f"{{{root_ns}}}Root": "RootType"},
+                "RootType": skxml.XsdTypeDef(attributes=["{ns2}a", "{ns1}b"]),
+            }
+        )
+
+    def get_transcoder(self, typename, tag=None):
+        return None
+
+
+def test_elementwrapper_to_dict_attribute_order():
+    root = lxml.etree.Element("{ns}Root")
+    root.set("{ns2}a", "1")
+    root.set("{ns1}b", "2")
+    wrapped = skxml.ElementWrapper(root, xsdhelper=_AttribOnlyXsdHelper("ns"))
+    assert list(wrapped.to_dict().items()) == [("@a", "1"), ("@b", "2")]
+    assert list(wrapped.to_dict()) == list(wrapped)
+
+
+def test_xsdtypedef_lookups():
+    typedef = skxml.XsdTypeDef(
+        attributes=["{ns}attr", "other"],
+        children=[
+            skxml.ChildDef("{ns}A", "AType"),
+            skxml.ChildDef("{ns}B", "BType", repeat=True),
+            skxml.ChildDef("{ns2}A", "A2Type"),
+        ],
+    )
+    assert typedef.get_childdef("{ns}B").typename == "BType"
+    assert typedef.get_childdef("{ns2}A").typename == "A2Type"
+    assert typedef.get_childdef("B") is None
+    assert typedef.get_childdef_from_localname("A").typename == "AType"
+    assert typedef.get_childdef_from_localname("C") is None
+    assert typedef.get_attribute_from_localname("attr") == "{ns}attr"
+    assert typedef.get_attribute_from_localname("other") == "other"
+    assert typedef.get_attribute_from_localname("missing") is None
+    assert skxml.loads_xsdtypes(skxml.dumps_xsdtypes({"T": typedef})) == {"T": typedef}
@@ -33,6 +33,24 @@ def test_xdt_aware(force_utc):
         assert xdt_t.parse_elem(elem) == dt.replace(tzinfo=None)
 
 
+@pytest.mark.parametrize(
+    "force_utc, tzinfo, expected",
+    (
+        (True, None, "2024-05-01T12:03:04.000000Z"),
+        (False, None, "2024-05-01T12:03:04.000000"),
+        (False, datetime.timezone.utc, "2024-05-01T12:03:04.000000Z"),
+        (
+            True,
+            datetime.timezone(datetime.timedelta(hours=1)),
+            "2024-05-01T11:03:04.000000Z",
+        ),
+    ),
+)
+def test_xdt_text(force_utc, tzinfo, expected):
+    dt = datetime.datetime(2024, 5, 1, 12, 3, 4, tzinfo=tzinfo)
+    assert skxt.XdtType(force_utc=force_utc).make_elem("Xdt", dt).text == expected
+
+
 @pytest.mark.parametrize("ndim", (1, 2))
 def test_poly(ndim):
     shape = np.arange(3, 3 + ndim)
@@ -42,6 +60,18 @@ def test_poly(ndim):
     assert np.array_equal(polytype.parse_elem(elem), coefs)
 
 
+def test_poly_sparse():
+    elem = lxml.etree.fromstring(
+        '<Poly order1="2" order2="1">'
+        '<Coef exponent1="2" exponent2="0">1.5</Coef>'
+        '<Coef exponent1="0" exponent2="1">-2.5</Coef>'
+        "</Poly>"
+    )
+    assert np.array_equal(
+        skxt.Poly2dType().parse_elem(elem), [[0, -2.5], [0, 0], [1.5, 0]]
+    )
+
+
 def test_xyzpoly():
     coefs = np.linspace(-10, 10, 33).reshape((11, 3))
     elem = skxt.XyzPolyType().make_elem("{faux-ns}XyzPoly", coefs)
@@ -66,6 +96,24 @@ def test_txt():
 def test_bool(val):
     elem = skxt.BoolType().make_elem("node", val)
     assert skxt.BoolType().parse_elem(elem) == val
+    text = str(val).lower()
+    assert skxt.BoolType().make_elem("node", np.bool_(val)).text == text
+    assert skxt.BoolType().make_elem("node", text).text == text
+    assert skxt.BoolType().make_elem("node", int(val)).text == str(int(val))
+
+
+@pytest.mark.parametrize("text", ("True", "yes", ""))
+def test_bool_invalid(text):
+    elem = lxml.etree.Element("node")
+    elem.text = text
+    with pytest.raises(ValueError, match="lexical space"):
+        skxt.BoolType().parse_elem(elem)
+
+
+@pytest.mark.parametrize("val", ("yes", "", 2, 1.0, 0.0, np.float64(1)))
+def test_bool_set_invalid(val):
+    with pytest.raises(ValueError, match="lexical space"):
+        skxt.BoolType().make_elem("node", val)
 
 
 @pytest.mark.parametrize("val", (1.23, -4.56j, 1.23 - 4.56j))